@@ -3,9 +3,9 @@ NFC Tag Copying functionality for the NFC Reader/Writer application.
 """
 
 import time
-from typing import List, Tuple, Callable, Optional, Any
+from typing import Tuple, Callable, Optional, Any
 
-from app.utils import GET_UID, extract_url_from_data, get_reader_specific_commands
+from app.utils import GET_UID, extract_url_from_data, get_reader_specific_commands, is_disconnect_error
 from app.reader import NFCReader
 from app.writer import NFCWriter
 
@@ -28,6 +28,7 @@ class NFCCopier:
         self.source_tag_url = None
         self.source_tag_uid = None
         self.copying = False
+        self.reading = False  # Cleared by stop_copy_operation to end a source tag read
         self.copies_made = 0
         self.max_retries = 3  # Maximum number of retries for operations
     
@@ -56,112 +57,109 @@ class NFCCopier:
             tag_info_callback("Waiting for source tag...")
         
         last_uid = None
-        timeout_time = time.time() + timeout
+        timeout_time = time.monotonic() + timeout
+        self.reading = True
         
-        while time.time() < timeout_time:
+        while self.reading and time.monotonic() < timeout_time:
             try:
-                connection, connected = self.reader.connect_with_retry()
-                if not connected:
-                    time.sleep(0.2)
-                    continue
-                
-                # Get UID with retry for reliability
-                uid = None
-                for retry in range(self.max_retries):
-                    reader_str = str(connection.getReader())
-                    commands = get_reader_specific_commands(reader_str)
-                    try:
-                        response, sw1, sw2 = connection.transmit(commands['GET_UID'])
-                        if sw1 == 0x90:
-                            uid = self.reader.toHexString(response)
-                            break
-                    except Exception:
-                        time.sleep(0.1)
-                
-                if not uid:
-                    connection.disconnect()
-                    time.sleep(0.2)
-                    continue
-                    
-                if status_callback:
-                    status_callback("Tag Detected - Reading...")
-                
-                # Only process if it's a new tag
-                if uid != last_uid:
-                    last_uid = uid
-                    if self.debug_callback:
-                        self.debug_callback("New tag detected", f"UID: {uid}")
+                # The connection stays open between polls while the same tag is present
+                with self.reader.card_connection(keep_alive=True) as connection:
+                    if connection is None:
+                        time.sleep(0.2)
+                        continue
                     
-                    # Read tag memory with multiple attempts for reliability
-                    memory_data = None
+                    # Get UID with retry for reliability
+                    uid = None
                     for retry in range(self.max_retries):
+                        reader_str = str(connection.getReader())
+                        commands = get_reader_specific_commands(reader_str)
                         try:
-                            # Use the extended read function to ensure we capture long URLs
-                            data = self.reader.read_tag_memory_full(connection)
-                            if data and len(data) > 8:  # Ensure we have enough data
-                                memory_data = data
+                            response, sw1, sw2 = connection.transmit(commands['GET_UID'])
+                            if sw1 == 0x90:
+                                uid = bytes(response).hex(' ').upper()
                                 break
-                        except Exception as e:
-                            if self.debug_callback:
-                                self.debug_callback("Error", f"Read attempt {retry+1} failed: {str(e)}")
-                            time.sleep(0.2)
+                        except Exception:
+                            time.sleep(0.1)
                     
-                    if memory_data:
-                        # Validate the data format
-                        is_valid = self._validate_tag_data(memory_data)
+                    if not uid:
+                        self.reader.release_connection()
+                        time.sleep(0.2)
+                        continue
                         
-                        if is_valid:
-                            self.source_tag_data = memory_data
-                            self.source_tag_uid = uid
-                            
-                            if self.debug_callback:
-                                self.debug_callback("Source tag", f"Read {len(memory_data)} bytes")
-                            
-                            # Extract URL or text from the tag data
-                            url = extract_url_from_data(memory_data, self.reader.toHexString)
-                            self.source_tag_url = url
+                    if status_callback:
+                        status_callback("Tag Detected - Reading...")
+                    
+                    # Only process if it's a new tag
+                    if uid != last_uid:
+                        last_uid = uid
+                        if self.debug_callback:
+                            self.debug_callback("New tag detected", f"UID: {uid}")
+                        
+                        # Read tag memory with multiple attempts for reliability
+                        memory_data = None
+                        for retry in range(self.max_retries):
+                            try:
+                                # Use the extended read function to ensure we capture long URLs
+                                data = self.reader.read_tag_memory_full(connection)
+                                if data and len(data) > 8:  # Ensure we have enough data
+                                    memory_data = data
+                                    break
+                            except Exception as e:
+                                if self.debug_callback:
+                                    self.debug_callback("Error", f"Read attempt {retry+1} failed: {str(e)}")
+                                time.sleep(0.2)
+                        
+                        if memory_data:
+                            # Validate the data format
+                            is_valid = self._validate_tag_data(memory_data)
                             
-                            # Display the URL with better formatting for long URLs
-                            if url:
+                            if is_valid:
+                                self.source_tag_data = memory_data
+                                self.source_tag_uid = uid
+                                
                                 if self.debug_callback:
-                                    self.debug_callback("URL Detected", f"Found URL: {url}")
+                                    self.debug_callback("Source tag", f"Read {len(memory_data)} bytes")
+                                
+                                # Extract URL or text from the tag data
+                                url = extract_url_from_data(memory_data, self.reader.toHexString, 0)
+                                self.source_tag_url = url
+                                
+                                # Display the URL with better formatting for long URLs
+                                if url:
+                                    if self.debug_callback:
+                                        self.debug_callback("URL Detected", f"Found URL: {url}")
+                                    
+                                    if tag_info_callback:
+                                        tag_info_callback(f"UID: {uid}\n\nURL Content:\n{url}")
+                                else:
+                                    if self.reader.debug_enabled and self.debug_callback:
+                                        self.debug_callback("Debug", "No URL found in tag data")
+                                    
+                                    if tag_info_callback:
+                                        tag_info_callback(f"Source Tag UID: {uid}\nContent: Raw data ({len(memory_data)} bytes)")
+                                
+                                if status_callback:
+                                    status_callback("Source tag read successfully")
                                 
-                                if tag_info_callback:
-                                    tag_info_callback(f"UID: {uid}\n\nURL Content:\n{url}")
+                                self.reader.release_connection()
+                                self.reading = False
+                                return True
                             else:
                                 if self.debug_callback:
-                                    self.debug_callback("Debug", "No URL found in tag data")
+                                    self.debug_callback("Error", "Invalid tag data format")
                                 
-                                if tag_info_callback:
-                                    tag_info_callback(f"Source Tag UID: {uid}\nContent: Raw data ({len(memory_data)} bytes)")
-                            
-                            if status_callback:
-                                status_callback("Source tag read successfully")
-                            
-                            connection.disconnect()
-                            return True
+                                if status_callback:
+                                    status_callback("Error: Invalid tag data format. Please try again.")
                         else:
                             if self.debug_callback:
-                                self.debug_callback("Error", "Invalid tag data format")
+                                self.debug_callback("Error", "Failed to read tag data after multiple attempts")
                             
                             if status_callback:
-                                status_callback("Error: Invalid tag data format. Please try again.")
-                    else:
-                        if self.debug_callback:
-                            self.debug_callback("Error", "Failed to read tag data after multiple attempts")
-                        
-                        if status_callback:
-                            status_callback("Error: Failed to read tag. Please try again.")
-                
-                connection.disconnect()
+                                status_callback("Error: Failed to read tag. Please try again.")
             except Exception as e:
                 error_msg = str(e)
                 # Only log errors that aren't common disconnection messages
-                if not any(msg in error_msg.lower() for msg in [
-                    "card is not connected",
-                    "no smart card inserted",
-                    "card is unpowered"
-                ]):
+                if not is_disconnect_error(error_msg):
                     if self.debug_callback:
                         self.debug_callback("Error", f"Scan error: {error_msg}")
                 
@@ -169,6 +167,13 @@ class NFCCopier:
                 
             time.sleep(0.2)  # Delay between scans
         
+        self.reader.release_connection()
+        
+        if not self.reading:
+            # Stopped by stop_copy_operation, which updates the UI itself
+            return False
+        self.reading = False
+        
         # Timeout
         if status_callback:
             status_callback("Timeout - No source tag detected")
@@ -178,12 +183,12 @@ class NFCCopier:
         
         return False
     
-    def _validate_tag_data(self, data: List[int]) -> bool:
+    def _validate_tag_data(self, data: bytearray) -> bool:
         """
         Validate tag data format.
         
         Args:
-            data: Raw tag data
+            data: Raw tag data as returned by read_tag_memory_full
             
         Returns:
             bool: True if data format is valid
@@ -191,16 +196,16 @@ class NFCCopier:
         if not data or len(data) < 8:
             return False
         
-        # Check for NDEF TLV structure
-        ndef_found = False
-        for i in range(len(data) - 2):
-            if data[i] == 0x03:  # NDEF TLV
-                length = data[i+1]
-                if i + 2 + length <= len(data):
-                    ndef_found = True
-                    break
+        # Check for NDEF TLV structure; bytearray.find skips between 0x03 candidates in C
+        end = len(data) - 2
+        i = data.find(0x03, 0, end)  # NDEF TLV
+        while i != -1:
+            length = data[i+1]
+            if i + 2 + length <= len(data):
+                return True
+            i = data.find(0x03, i + 1, end)
         
-        return ndef_found
+        return False
     
     def copy_to_new_tags(self, quantity: int, lock: bool = True,
                          status_callback: Optional[Callable[[str], None]] = None,
@@ -268,7 +273,7 @@ class NFCCopier:
                     try:
                         response, sw1, sw2 = connection.transmit(commands['GET_UID'])
                         if sw1 == 0x90:
-                            uid = self.reader.toHexString(response)
+                            uid = bytes(response).hex(' ').upper()
                             break
                     except Exception:
                         time.sleep(0.1)
@@ -337,11 +342,7 @@ class NFCCopier:
                 connection.disconnect()
             except Exception as e:
                 error_msg = str(e)
-                if not any(msg in error_msg.lower() for msg in [
-                    "card is not connected",
-                    "no smart card inserted",
-                    "card is unpowered"
-                ]) and status_callback:
+                if not is_disconnect_error(error_msg) and status_callback:
                     status_callback(f"Error: {error_msg}")
                 
             time.sleep(0.2)
@@ -367,7 +368,7 @@ class NFCCopier:
                 return False
             
             # Extract URL from the tag data
-            url = extract_url_from_data(memory_data, self.reader.toHexString)
+            url = extract_url_from_data(memory_data, self.reader.toHexString, 0)
             
             # Compare with expected URL
             if url and url == expected_url:
@@ -392,8 +393,9 @@ class NFCCopier:
             return False
     
     def stop_copy_operation(self):
-        """Stop the ongoing copy operation."""
+        """Stop the ongoing copy operation or source tag read."""
         self.copying = False
+        self.reading = False
     
     def reset(self):
         """Reset the copier state."""
@@ -401,4 +403,5 @@ class NFCCopier:
         self.source_tag_url = None
         self.source_tag_uid = None
         self.copying = False
+        self.reading = False
         self.copies_made = 0
\ No newline at end of file
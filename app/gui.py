@@ -5,35 +5,418 @@ Main GUI class for the NFC Reader/Writer application.
 import sys
 import threading
 import time
-import queue
-import urllib.request
-from typing import Optional, List, Tuple
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Optional, Tuple
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTabWidget,
                              QMessageBox, QApplication, QLabel, QHBoxLayout,
                              QSizePolicy)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QByteArray, QSize, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QKeySequence, QShortcut, QColor, QPalette
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, pyqtSlot, QSize, QPropertyAnimation,
+                          QEasingCurve, QStandardPaths, QUrl, QDir)
+from PyQt6.QtGui import QIcon, QPixmap, QKeySequence, QShortcut, QColor, QPalette
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
-from app.ui.read_tab import ReadTab
+from app.ui.read_tab import ReadTab, LOG_MAX_LINES
 from app.ui.write_tab import WriteTab
 from app.ui.copy_tab import CopyTab
 from app.ui.about_tab import AboutTab
 from app.reader import NFCReader
 from app.writer import NFCWriter
 from app.copier import NFCCopier
-from app.utils import extract_url_from_data, open_url_in_browser, validate_url
+from app.worker import NFCWorker
+from app.utils import extract_url_from_data, is_disconnect_error, open_url_in_browser, validate_url
+
+# Widget-specific styles, keyed by object name and shared by the light and dark themes
+WIDGET_STYLES = """
+    QLabel#url_label {
+        font-size: 11px;
+        color: #1976D2;
+        padding: 4px;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #f5f5f5;
+        min-height: 25px;
+    }
+    QPlainTextEdit#log_text {
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+        line-height: 1.3;
+        background-color: #f8f8f8;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QLabel#input_label {
+        font-weight: bold;
+        color: #1976d2;
+        margin-bottom: 5px;
+    }
+    QLineEdit#url_entry {
+        font-size: 12px;
+        padding: 4px;
+        border: 1px solid #e0e0e0;
+        border-radius: 3px;
+        margin-bottom: 3px;
+        margin-top: 2px;
+        min-width: 200px;
+    }
+    QLineEdit#url_entry:focus {
+        border: 2px solid #1976d2;
+        background-color: #f5f5f5;
+    }
+    QLineEdit#url_entry::placeholder {
+        color: #9e9e9e;
+    }
+    QPushButton#icon_button_blue {
+        color: #1976d2;
+        background-color: white;
+        border: 1px solid #1976d2;
+        border-radius: 16px;
+        font-size: 16px;
+        padding: 0;
+    }
+    QPushButton#icon_button_blue:hover {
+        background-color: #e3f2fd;
+    }
+    QPushButton#icon_button_red {
+        color: #f44336;
+        background-color: white;
+        border: 1px solid #f44336;
+        border-radius: 16px;
+        font-size: 16px;
+        padding: 0;
+    }
+    QPushButton#icon_button_red:hover {
+        background-color: #ffebee;
+    }
+    QGroupBox#status_group {
+        background: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 6px;
+        margin-top: 1.5em;
+        font-weight: bold;
+    }
+    QGroupBox#status_group::title {
+        subcontrol-origin: margin;
+        left: 8px;
+        padding: 0 3px;
+        color: #1976d2;
+    }
+    QLabel#source_tag_info {
+        font-size: 11px;
+        color: #1976D2;
+        padding: 4px;
+        background-color: #E3F2FD;
+        border-radius: 3px;
+        min-height: 30px;
+    }
+    QPushButton#reset_button {
+        background-color: #FF9800;
+        color: white;
+    }
+    QPushButton#reset_button:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#stop_button {
+        background-color: #F44336;
+        color: white;
+    }
+    QPushButton#stop_button:hover {
+        background-color: #D32F2F;
+    }
+    QLabel#version_label {
+        font-weight: bold;
+        color: #1976d2;
+        margin: 10px 0;
+    }
+    QLabel#desc_label {
+        margin: 10px 0;
+    }
+    QTextEdit#manual_text, QTextEdit#changelog_text {
+        background-color: #fafafa;
+        border: none;
+        padding: 15px;
+    }
+    QTabWidget#main_tabs::pane {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background: white;
+        margin-top: -1px;
+    }
+    QTabWidget#main_tabs QTabBar::tab {
+        padding: 6px 10px;
+        margin-right: 1px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        border: 1px solid #e0e0e0;
+        border-bottom: none;
+        background: #f5f5f5;
+        font-size: 12px;
+    }
+    QTabWidget#main_tabs QTabBar::tab:selected {
+        background: white;
+        border-bottom: 2px solid #1976d2;
+        font-weight: bold;
+    }
+    QTabWidget#main_tabs QTabBar::tab:hover:!selected {
+        background: #eeeeee;
+    }
+    QLabel#reader_status_text {
+        font-size: 11px;
+    }
+    QLabel#tag_type_label {
+        color: #1976d2;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QStatusBar {
+        border-top: 1px solid #d0d0d0;
+        font-size: 11px;
+    }
+    QStatusBar QLabel {
+        padding: 2px 4px;
+        font-size: 11px;
+    }
+"""
+
+# Full application stylesheets, built once at import
+LIGHT_THEME_STYLES = """
+    /* Global styles */
+    QMainWindow, QWidget {
+        background-color: #ffffff;
+        color: #000000;
+    }
+
+    /* Main window style */
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #e8e8e8);
+    }
+
+    /* Add spacing between sections */
+    QGroupBox {
+        border-radius: 12px;
+        margin-top: 1.5em;
+        padding: 15px;
+        color: #000000;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8f8f8);
+        border: 1px solid rgba(0,0,0,0.15);
+    }
+    QTabWidget::pane {
+        border: 1px solid #d0d0d0;
+        background-color: #ffffff;
+        border-radius: 4px;
+        margin-top: -1px;
+    }
+    QTabBar::tab {
+        background-color: #f0f0f0;
+        color: #000000;
+        padding: 6px 10px;
+        border: 1px solid #d0d0d0;
+        border-bottom: none;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        font-weight: 600;
+        font-size: 12px;
+        min-width: 50px;
+    }
+    QTabBar::tab:selected {
+        background-color: #ffffff;
+        border-bottom: 2px solid #1976d2;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #e8e8e8;
+    }
+    QLabel {
+        color: #000000;
+    }
+    QLabel#status_label {
+        color: #1976d2;
+        font-weight: 600;
+        padding: 8px;
+        background-color: #e3f2fd;
+        border-radius: 4px;
+        margin: 5px 0;
+        font-size: 13px;
+        border: 1px solid #bbdefb;
+        min-height: 18px;
+    }
+
+    QPushButton {
+        background-color: #1976d2;
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-weight: 600;
+        min-width: 120px;
+        font-size: 13px;
+        border: 1px solid rgba(0,0,0,0.2);
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1e88e5, stop:1 #1976d2);
+    }
+
+    QPushButton:disabled {
+        background-color: #bdbdbd;
+        color: #757575;
+    }
+    QPushButton:hover {
+        background-color: #1e88e5;
+    }
+    QPushButton:pressed {
+        background-color: #1565c0;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #ffffff;
+        color: #000000;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 8px;
+        selection-background-color: #bbdefb;
+    }
+    QLineEdit {
+        background-color: #ffffff;
+        color: #000000;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 8px;
+        selection-background-color: #bbdefb;
+                font-size: 14px;
+        min-width: 200px;
+        min-height: 24px;
+        margin-right: 5px;
+    }
+
+    QLineEdit:focus {
+        border: 2px solid #1976d2;
+    }
+    QSpinBox {
+        background-color: #ffffff;
+        color: #000000;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        min-width: 80px;
+        min-height: 24px;
+        padding: 6px;
+    }
+    QCheckBox {
+        color: #000000;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #d0d0d0;
+        background-color: #ffffff;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #1976d2;
+        background-color: #1976d2;
+        image: url(icons:check.svg);
+    }
+""" + WIDGET_STYLES
+
+DARK_THEME_STYLES = """
+    QMainWindow, QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QTabWidget::pane {
+        border: 1px solid #3d3d3d;
+        background-color: #2b2b2b;
+    }
+    QTabBar::tab {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: 1px solid #4d4d4d;
+    }
+    QTabBar::tab:selected {
+        background-color: #2b2b2b;
+        border-bottom: 2px solid #1976d2;
+    }
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: 1px solid #4d4d4d;
+    }
+    QPushButton {
+        background-color: #1976d2;
+        color: white;
+        border: none;
+    }
+    QGroupBox {
+        border: 1px solid #4d4d4d;
+        color: #ffffff;
+    }
+""" + WIDGET_STYLES
+
+# How long a scanned tag's parsed URL is reused if the same tag is presented again (seconds)
+SCAN_UID_CACHE_TTL = 2.0
+
+# Most recently scanned tags kept in that cache
+SCAN_UID_CACHE_SIZE = 16
+
+# Scanning the same URL again within this window does not open another browser tab (seconds)
+URL_REOPEN_INTERVAL = 5.0
+
+# Log titles shown even when debug mode is off
+LOG_TITLES_ALWAYS_SHOWN = frozenset(("Error", "URL Detected", "System", "Text Record"))
+
+# Log title colors; titles not listed are shown in black
+LOG_TITLE_COLORS = {
+    "Error": "#D32F2F",
+    "Debug": "#1976D2",
+    "System": "#388E3C",
+    "URL Detected": "#7B1FA2",
+    "Browser": "#F57C00",
+    "Text Record": "#00796B"
+}
+
+# Bundled artwork; PyInstaller unpacks it under sys._MEIPASS
+IMAGES_DIR = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent)) / "images"
+
+# Remote fallback for the About tab icon when images/acr_1252.png is missing
+ABOUT_ICON_URL = "https://res.cloudinary.com/drrvnflqy/image/upload/v1738978376/acr_1252_jcozss.png"
+ABOUT_ICON_TIMEOUT_MS = 5000
+
+class ReaderChangeObserver:
+    """pyscard reader observer that forwards hot-plug events to the GUI thread."""
+    
+    def __init__(self, signal):
+        """
+        Initialize the observer.
+        
+        Args:
+            signal: Qt signal emitted whenever readers are added or removed
+        """
+        self.signal = signal
+    
+    def update(self, observable, handlers):
+        """Called by pyscard's monitor thread with (added, removed) readers."""
+        self.signal.emit()
 
 class NFCReaderGUI(QMainWindow):
     """Main GUI class for the NFC Reader/Writer application."""
     
     # Signals for thread-safe GUI updates
     status_signal = pyqtSignal(str)
-    log_signal = pyqtSignal(str, str)
+    log_ready_signal = pyqtSignal()  # worker log lines are waiting in the log queue
     write_status_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(str)
     progress_value_signal = pyqtSignal(int, int)  # current, total
     url_signal = pyqtSignal(str)
+    open_url_signal = pyqtSignal(str)
+    tag_signal = pyqtSignal(dict)  # scan result: present, plus tag_type when present
+    reader_change_signal = pyqtSignal()
+    reader_state_signal = pyqtSignal(bool, str)  # found, message
+    scan_stopped_signal = pyqtSignal()  # the worker ended scanning by itself
+    copy_status_signal = pyqtSignal(str)
+    copy_tag_info_signal = pyqtSignal(str)
+    copy_progress_signal = pyqtSignal(int, int)  # current, total
     
     def __init__(self):
         """Initialize the main application window."""
@@ -43,6 +426,9 @@ class NFCReaderGUI(QMainWindow):
         # Initialize theme state
         self.dark_mode = False
         
+        # Cache the application clipboard for copy/paste actions
+        self._clip = QApplication.clipboard()
+        
         # Get status bar reference
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Ready")
@@ -68,16 +454,53 @@ class NFCReaderGUI(QMainWindow):
         
         # Initialize variables
         self.scanning = False
-        self.scan_thread = None
-        self.tag_queue = queue.Queue()
+        self._scan_session = 0
+        self._scan_stop_event = threading.Event()
+        self._last_validated_text = None
+        self._last_validation = (False, "")
+        self._pending_validation_text = ""
+        self._last_status_text = None
+        self._last_url_text = None
+        self._last_reader_state = None
+        self._reader_check_pending = False
+        
+        # Log lines from the card worker, drained by the GUI thread in batches;
+        # bounded like the log view, so a stalled GUI keeps only the newest lines
+        self._log_queue = deque(maxlen=LOG_MAX_LINES)
+        self._log_queue_lock = threading.Lock()
         self.scan_timeout = 30  # 30 seconds timeout
-        self.active_threads = []  # Track active threads
+        self._last_opened_url = None
+        self._last_opened_time = 0
         
         # Initialize reader, writer, and copier
         self.nfc_reader = NFCReader(self.readers_func, self.toHexString, self.debug_callback)
         self.nfc_writer = NFCWriter(self.toHexString, self.debug_callback)
         self.nfc_copier = NFCCopier(self.nfc_reader, self.nfc_writer, self.debug_callback)
         
+        # All card I/O runs serially on one long-lived worker thread
+        self.nfc_worker = NFCWorker()
+        self.nfc_worker.job_failed.connect(lambda message: self.append_log("Error", message))
+        self.nfc_worker.start()
+        self._close_pending = False  # Set while closing waits for a card operation to return
+        
+        # Coalesce per-keystroke URL validation in the write tab
+        self.validation_timer = QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(50)
+        self.validation_timer.timeout.connect(
+            lambda: self.validate_write_input(self._pending_validation_text))
+        
+        # Log timestamps only change once a second, so format them once a second
+        self._log_timestamp_second = None
+        self._log_timestamp = ""
+        
+        # Coalesce write-tab status and progress updates to one repaint per frame
+        self._pending_write_updates = {}
+        self.write_update_timer = QTimer(self)
+        self.write_update_timer.setSingleShot(True)
+        self.write_update_timer.setInterval(16)
+        self.write_update_timer.timeout.connect(self.flush_write_updates)
+        
         # Setup UI
         self.setup_ui()
         
@@ -93,32 +516,44 @@ class NFCReaderGUI(QMainWindow):
         
         # Connect signals
         self.status_signal.connect(self.update_status_label)
-        self.log_signal.connect(self.append_log)
+        self.log_ready_signal.connect(self.drain_log_queue)
         self.write_status_signal.connect(self.update_write_status)
         self.progress_signal.connect(self.update_progress)
         self.url_signal.connect(self.update_url_label)
+        self.open_url_signal.connect(self.open_scanned_url)
+        self.tag_signal.connect(self.update_tag_widgets)
+        self.reader_state_signal.connect(self.update_reader_state)
+        self.scan_stopped_signal.connect(self.on_scan_stopped)
         self.progress_value_signal.connect(self.update_progress_bar)
+        self.copy_status_signal.connect(self.on_copy_status)
+        self.copy_tag_info_signal.connect(self.on_tag_info)
+        self.copy_progress_signal.connect(self.on_copy_progress)
+        
+        # Watch for reader hot-plug events; the timer is only a fallback watchdog
+        self.reader_change_signal.connect(self.on_readers_changed)
+        self.reader_monitor = None
+        self.reader_observer = None
+        try:
+            from smartcard.ReaderMonitoring import ReaderMonitor
+            self.reader_observer = ReaderChangeObserver(self.reader_change_signal)
+            self.reader_monitor = ReaderMonitor()
+            self.reader_monitor.addObserver(self.reader_observer)
+        except Exception:
+            self.reader_monitor = None
         
-        # Start checking for reader
         self.check_reader_timer = QTimer()
         self.check_reader_timer.timeout.connect(self.check_reader)
-        self.check_reader_timer.start(2000)
+        self.check_reader_timer.start(10000 if self.reader_monitor else 2000)
+        QTimer.singleShot(0, self.check_reader)
         
-        # Setup queue check timer
-        self.queue_timer = QTimer()
-        self.queue_timer.timeout.connect(self.check_tag_queue)
-        self.queue_timer.start(100)
+        # Resolve stylesheet artwork such as url(icons:check.svg) from the images folder
+        QDir.addSearchPath("icons", str(IMAGES_DIR))
         
         # Apply light theme by default
         self.apply_light_theme()
         
         # Create unified status bar
         self.setup_unified_status_area()
-        
-        # Thread cleanup timer
-        self.thread_cleanup_timer = QTimer()
-        self.thread_cleanup_timer.timeout.connect(self.cleanup_threads)
-        self.thread_cleanup_timer.start(10000)  # Check every 10 seconds
     
     def setup_ui(self):
         """Setup the main user interface."""
@@ -134,33 +569,8 @@ class NFCReaderGUI(QMainWindow):
         self.tab_widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.tab_widget.setTabEnabled(0, True)
         self.tab_widget.setTabEnabled(1, True)
-        # Set a more compact tab style
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                background: white;
-                margin-top: -1px;
-            }
-            QTabBar::tab {
-                padding: 6px 10px;
-                margin-right: 1px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                border: 1px solid #e0e0e0;
-                border-bottom: none;
-                background: #f5f5f5;
-                font-size: 12px;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                border-bottom: 2px solid #1976d2;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #eeeeee;
-            }
-        """)
+        # Compact tab style is applied through WIDGET_STYLES
+        self.tab_widget.setObjectName("main_tabs")
         layout.addWidget(self.tab_widget)
         
         # Create tabs
@@ -179,9 +589,6 @@ class NFCReaderGUI(QMainWindow):
         self.tab_widget.addTab(self.write_tab, "Write Tags")
         self.tab_widget.addTab(self.copy_tab, "Copy Tags")
         self.tab_widget.addTab(self.about_tab, "About")
-        
-        # Load icon for about tab
-        self.load_about_icon()
     
     def connect_read_tab_signals(self):
         """Connect signals from the read tab."""
@@ -198,7 +605,7 @@ class NFCReaderGUI(QMainWindow):
         self.write_tab.clear_clicked.connect(self.clear_write_entry)
         self.write_tab.test_url_clicked.connect(self.test_url)
         self.write_tab.clear_status_clicked.connect(lambda: self.write_tab.update_write_status(""))
-        self.write_tab.text_changed.connect(self.validate_write_input)
+        self.write_tab.text_changed.connect(self.schedule_write_validation)
     
     def connect_copy_tab_signals(self):
         """Connect signals from the copy tab."""
@@ -248,18 +655,6 @@ class NFCReaderGUI(QMainWindow):
         self.status_bar.addPermanentWidget(self.tag_status)
         self.status_bar.addPermanentWidget(QLabel("|"))  # Separator
         self.status_bar.addPermanentWidget(self.theme_status)
-        
-        # Style the status bar
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                border-top: 1px solid #d0d0d0;
-                font-size: 11px;
-            }
-            QLabel {
-                padding: 2px 4px;
-                font-size: 11px;
-            }
-        """)
     
     def setup_unified_status_area(self):
         """Setup a unified status area that appears in all tabs."""
@@ -277,11 +672,11 @@ class NFCReaderGUI(QMainWindow):
         # Reader status text
         self.reader_status_text = QLabel("Reader: Not Connected")
         self.reader_status_text.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
-        self.reader_status_text.setStyleSheet("font-size: 11px;")
+        self.reader_status_text.setObjectName("reader_status_text")
         
         # Tag type indicator
         self.tag_type_label = QLabel("Tag Type: Unknown")
-        self.tag_type_label.setStyleSheet("color: #1976d2; font-weight: bold; font-size: 11px;")
+        self.tag_type_label.setObjectName("tag_type_label")
         self.tag_type_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.tag_type_label.setWordWrap(True)
         
@@ -292,235 +687,104 @@ class NFCReaderGUI(QMainWindow):
         
         # Add to main window at the top
         self.centralWidget().layout().insertWidget(0, self.unified_status_widget)
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                border-top: 1px solid #d0d0d0;
-                font-size: 11px;
-            }
-            QLabel {
-                padding: 2px 4px;
-                font-size: 11px;
-            }
-        """)
     
     def load_about_icon(self):
-        """Load icon for the about tab."""
+        """Load icon for the about tab without blocking the GUI thread."""
+        # Try to load from local file first
+        pixmap = QPixmap(str(IMAGES_DIR / "acr_1252.png"))
+        if not pixmap.isNull():
+            self.about_tab.set_icon(pixmap)
+            return
+        
+        # Then the on-disk cache of a previous download
+        cache_path = self._about_icon_cache_path()
+        if cache_path.exists() and pixmap.load(str(cache_path)):
+            self.about_tab.set_icon(pixmap)
+            return
+        
+        # Show the default icon until the remote fetch completes
+        self.about_tab.set_icon(None)
+        self._icon_network = QNetworkAccessManager(self)
+        self._icon_network.finished.connect(self._on_about_icon_downloaded)
+        request = QNetworkRequest(QUrl(ABOUT_ICON_URL))
+        request.setTransferTimeout(ABOUT_ICON_TIMEOUT_MS)
+        self._icon_network.get(request)
+    
+    def _about_icon_cache_path(self):
+        """Get the on-disk cache location for the downloaded about icon."""
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        return Path(cache_dir) / "acr_1252.png"
+    
+    def _on_about_icon_downloaded(self, reply):
+        """Handle the finished about icon download."""
         try:
-            # Try to load from local file first
-            pixmap = QPixmap("images/acr_1252.png")
-            if not pixmap.isNull():
-                self.about_tab.set_icon(pixmap)
+            if reply.error() != QNetworkReply.NetworkError.NoError:
                 return
             
-            # If local file fails, try remote URL
-            icon_url = "https://res.cloudinary.com/drrvnflqy/image/upload/v1738978376/acr_1252_jcozss.png"
-            response = urllib.request.urlopen(icon_url)
-            image_data = response.read()
-            
-            # Create QPixmap from downloaded data
+            image_data = reply.readAll()
             pixmap = QPixmap()
-            pixmap.loadFromData(QByteArray(image_data))
+            if not pixmap.loadFromData(image_data):
+                return
+            self.about_tab.set_icon(pixmap)
             
-            if not pixmap.isNull():
-                self.about_tab.set_icon(pixmap)
-            else:
-                raise Exception("Failed to load image")
-        except Exception:
-            # Create a default icon if image cannot be loaded
-            self.about_tab.set_icon(None)
+            # Cache the image so later starts don't touch the network
+            try:
+                cache_path = self._about_icon_cache_path()
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(image_data.data())
+            except OSError:
+                pass
+        finally:
+            reply.deleteLater()
     
     def apply_light_theme(self):
         """Apply light theme to the application."""
-        self.setStyleSheet("""
-            /* Global styles */
-            QMainWindow, QWidget {
-                background-color: #ffffff;
-                color: #000000;
-                font-family: 'Ubuntu', 'Segoe UI', sans-serif;
-            }
-            
-            /* Main window style */
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #e8e8e8);
-            }
-            
-            /* Add spacing between sections */
-            QGroupBox {
-                border: 1px solid #d0d0d0;
-                border-radius: 12px;
-                margin-top: 1.5em;
-                padding-top: 1.5em;
-                padding: 15px;
-                color: #000000;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8f8f8);
-                border: 1px solid rgba(0,0,0,0.15);
-            }
-            QTabWidget::pane {
-                border: 1px solid #d0d0d0;
-                background-color: #ffffff;
-                border-radius: 4px;
-                margin-top: -1px;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                color: #000000;
-                padding: 6px 10px;
-                border: 1px solid #d0d0d0;
-                border-bottom: none;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-weight: 600;
-                font-size: 12px;
-                min-width: 50px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom: 2px solid #1976d2;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #e8e8e8;
-            }
-            QLabel {
-                color: #000000;
-            }
-            QLabel#status_label {
-                color: #1976d2;
-                font-weight: 600;
-                padding: 8px;
-                background-color: #e3f2fd;
-                border-radius: 4px;
-                margin: 5px 0;
-                font-size: 13px;
-                border: 1px solid #bbdefb;
-                min-height: 18px;
-            }
-            
-            QPushButton {
-                background-color: #1976d2;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 600;
-                min-width: 120px;
-                font-size: 13px;
-                border: 1px solid rgba(0,0,0,0.2);
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e88e5, stop:1 #1976d2);
-            }
-            
-            QPushButton:disabled {
-                background-color: #bdbdbd;
-                color: #757575;
-            }
-            QPushButton:hover {
-                background-color: #1e88e5;
-            }
-            QPushButton:pressed {
-                background-color: #1565c0;
-            }
-            QTextEdit {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 8px;
-                selection-background-color: #bbdefb;
-            }
-            QLineEdit {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 8px;
-                selection-background-color: #bbdefb;
-                font-family: 'Segoe UI';
-                font-size: 14px;
-                min-width: 200px;
-                min-height: 24px;
-                margin-right: 5px;
-            }
-            
-            QLineEdit:focus {
-                border: 2px solid #1976d2;
-            }
-            QSpinBox {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                min-width: 80px;
-                min-height: 24px;
-                padding: 6px;
-            }
-            QCheckBox {
-                color: #000000;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #d0d0d0;
-                background-color: #ffffff;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #1976d2;
-                background-color: #1976d2;
-                image: url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxNiIgaGVpZ2h0PSIxNiIgdmlld0JveD0iMCAwIDE2IDE2Ij48cGF0aCBmaWxsPSIjZmZmIiBkPSJNNi4yIDEwLjhsLTMtMy0xLjQgMS40IDQuNCA0LjQgOC44LTguOC0xLjQtMS40eiIvPjwvc3ZnPg==);
-            }
-        """)
+        self.setStyleSheet(LIGHT_THEME_STYLES)
         self.theme_status.setText("Light Mode")
     
     def toggle_theme(self):
         """Toggle between light and dark themes."""
         self.dark_mode = not self.dark_mode
         if self.dark_mode:
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #3d3d3d;
-                    background-color: #2b2b2b;
-                }
-                QTabBar::tab {
-                    background-color: #3d3d3d;
-                    color: #ffffff;
-                    border: 1px solid #4d4d4d;
-                }
-                QTabBar::tab:selected {
-                    background-color: #2b2b2b;
-                    border-bottom: 2px solid #1976d2;
-                }
-                QLineEdit, QTextEdit, QComboBox {
-                    background-color: #3d3d3d;
-                    color: #ffffff;
-                    border: 1px solid #4d4d4d;
-                }
-                QPushButton {
-                    background-color: #1976d2;
-                    color: white;
-                    border: none;
-                }
-                QGroupBox {
-                    border: 1px solid #4d4d4d;
-                    color: #ffffff;
-                }
-            """)
+            self.setStyleSheet(DARK_THEME_STYLES)
             self.theme_status.setText("Dark Mode")
         else:
             self.apply_light_theme()
     
+    def on_readers_changed(self):
+        """Re-check the reader after a hot-plug event, bypassing the enumeration cache."""
+        self.nfc_reader.invalidate_readers()
+        self.check_reader()
+    
     def check_reader(self):
-        """Check for ACR1252U reader and update status."""
-        result, message = self.nfc_reader.find_reader()
+        """Queue a reader check on the card worker thread."""
+        # PC/SC enumeration can block, so it never runs on the GUI thread;
+        # at most one check waits in the queue, so checks never crowd out card jobs
+        if self._reader_check_pending:
+            return
+        self._reader_check_pending = True
+        if not self.nfc_worker.submit(self.find_reader_job):
+            self._reader_check_pending = False
+    
+    def find_reader_job(self):
+        """Look up the NFC reader and report the result to the GUI thread."""
+        try:
+            result, message = self.nfc_reader.find_reader()
+        finally:
+            self._reader_check_pending = False
+        self.reader_state_signal.emit(result, message)
+    
+    @pyqtSlot(bool, str)
+    def update_reader_state(self, result, message):
+        """Update the reader status widgets from a reader check."""
+        self.update_status_label(f"Status: {message}")
+        
+        # The reader widgets only need repainting when the reader state changes
+        if (result, message) == self._last_reader_state:
+            return
+        self._last_reader_state = (result, message)
+        
         if result:
-            self.read_tab.update_status(f"Status: {message}")
             self.status_bar.showMessage(f"{message} and ready")
             self.reader_status_text.setText(f"Reader: {message}")
             self.reader_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 7px;")  # Green
@@ -531,13 +795,14 @@ class NFCReaderGUI(QMainWindow):
             self.reader_status_text.setText("Reader: Not Connected")
             self.reader_indicator.setStyleSheet("background-color: #FFA500; border-radius: 7px;")  # Orange
             self.tag_type_label.setText("Tag Type: Unknown")
-            
-            # Update status messages
-            self.read_tab.update_status(f"Status: {message}")
             self.status_bar.showMessage("Reader not found - Please connect an NFC reader")
     
     def on_tab_changed(self, index):
         """Handle tab change events."""
+        if index == self.tab_widget.indexOf(self.about_tab):
+            # Build the About content and fetch its icon only once the tab is first shown
+            if self.about_tab.load_content():
+                self.load_about_icon()
         if (index == 1 or index == 2) and self.scanning:  # Index 1 is Write Tags tab, Index 2 is Copy Tags tab
             self.toggle_scanning(False)  # Stop scanning when switching to write tab
         if index == 2 and self.nfc_copier.copying:  # Index 2 is Copy Tags tab
@@ -564,202 +829,237 @@ class NFCReaderGUI(QMainWindow):
         
         if start_scanning and not self.scanning:
             self.scanning = True
+            self._scan_stop_event.clear()
             self.read_tab.scan_button.setText("Stop Scanning")
             self.read_tab.scan_button.setStyleSheet("background-color: #c62828;")  # Red for stop
             self.append_log("System", f"Started scanning for tags (will timeout after {self.scan_timeout} seconds of inactivity)")
             
-            # Create and start a new scan thread
-            self.scan_thread = threading.Thread(target=self.scan_loop, daemon=True)
-            self.scan_thread.start()
-            self.active_threads.append(self.scan_thread)
+            # A batch write or copy would hold the worker until it finishes
+            self.stop_card_operations()
+            
+            # Run the scan loop on the card worker thread
+            if not self.submit_card_job(self.scan_loop):
+                self.toggle_scanning(False)
             
         elif not start_scanning and self.scanning:
             self.scanning = False
+            # Cut short any connection retry backoff the scan is waiting in
+            self._scan_stop_event.set()
             self.read_tab.scan_button.setText("Start Scanning")
             self.read_tab.scan_button.setStyleSheet("")  # Reset to default style
             self.append_log("System", "Stopped scanning")
     
+    @pyqtSlot()
+    def on_scan_stopped(self):
+        """Reset the scan button after the worker stopped scanning on a timeout or error."""
+        if not self.scanning:
+            self.read_tab.scan_button.setText("Start Scanning")
+            self.read_tab.scan_button.setStyleSheet("")  # Reset to default style
+    
     def scan_loop(self):
-        """Continuous scanning loop."""
-        last_uid = None
-        last_activity_time = time.time()
-        consecutive_errors = 0
+        """Start a scanning session on the card worker thread."""
+        self._scan_session += 1
+        self._scan_last_uid = None
+        self._scan_uid_cache = OrderedDict()
+        self._scan_last_activity = time.monotonic()
+        self._scan_errors = 0
+        self.scan_tick(self._scan_session)
+    
+    def scan_tick(self, session):
+        """Poll the reader once and schedule the next poll."""
+        # A newer session (or a stop) supersedes this one
+        if not self.scanning or session != self._scan_session:
+            if not self.scanning:
+                self.nfc_reader.release_connection()
+            return
+        
+        try:
+            delay_ms = self.scan_once()
+        except Exception as e:
+            # Catch any unhandled exceptions in the scan loop to prevent app crashes
+            self.post_log("Critical Error", f"Scan loop error: {str(e)}")
+            self.status_signal.emit(f"Status: Scanning stopped due to error: {str(e)}")
+            delay_ms = None
+        
+        if delay_ms is not None and self.scanning:
+            self.nfc_worker.submit_later(delay_ms, self.scan_tick, session)
+            return
+        
+        self.nfc_reader.release_connection()
+        if self.scanning and session == self._scan_session:
+            # Update UI to reflect stopped scanning (from the GUI thread)
+            self.scanning = False
+            self.scan_stopped_signal.emit()
+    
+    def scan_once(self):
+        """
+        Run a single scan iteration.
+        
+        Returns:
+            Optional[int]: Delay before the next poll in milliseconds, or None to stop scanning
+        """
         max_consecutive_errors = 5
         
+        # Check for timeout
+        if time.monotonic() - self._scan_last_activity > self.scan_timeout:
+            self.post_log("System", f"Scanning stopped after {self.scan_timeout} seconds of inactivity")
+            # Update UI from main thread
+            self.status_signal.emit("Status: Scanning timed out - No recent activity")
+            return None
+        
+        # If we've had too many consecutive errors, take a short break to let the system recover
+        if self._scan_errors >= max_consecutive_errors:
+            self.post_log("System", "Too many consecutive errors - pausing briefly")
+            self._scan_errors = 0  # Reset the counter
+            return 1000  # Take a longer break
+        
         try:
-            while self.scanning:
-                # Check for timeout
-                if time.time() - last_activity_time > self.scan_timeout:
-                    self.append_log("System", f"Scanning stopped after {self.scan_timeout} seconds of inactivity")
-                    self.scanning = False
-                    # Update UI from main thread
-                    self.status_signal.emit("Status: Scanning timed out - No recent activity")
-                    break
-                
-                # If we've had too many consecutive errors, take a short break to let the system recover
-                if consecutive_errors >= max_consecutive_errors:
-                    self.append_log("System", "Too many consecutive errors - pausing briefly")
-                    time.sleep(1.0)  # Take a longer break
-                    consecutive_errors = 0  # Reset the counter
-                
-                try:
-                    if self.nfc_reader.reader:
-                        connection, connected = self.nfc_reader.connect_with_retry()
-                        if not connected:
-                            time.sleep(0.2)
-                            continue
-                        
-                        # Get UID
-                        try:
-                            uid = self.nfc_reader.get_tag_uid(connection)
-                            if uid:
-                                # Reset error counter on successful operation
-                                consecutive_errors = 0
-                                
-                                # Update UI via signals
-                                self.status_signal.emit("Tag Ready")                        
-                                self.write_status_signal.emit("Tag Ready - Click Write to proceed")
-                                self.write_tab.update_tag_status(True)
-                                self.tag_status.setText("Tag Present")  # Update status bar
+            if self.nfc_reader.reader:
+                # The connection stays open between polls while the same tag is present
+                with self.nfc_reader.card_connection(keep_alive=True,
+                                                      stop_event=self._scan_stop_event) as connection:
+                    if connection is None:
+                        return 200
+                    
+                    # Get UID
+                    try:
+                        uid = self.nfc_reader.get_tag_uid(connection)
+                        if uid:
+                            # Reset error counter on successful operation
+                            self._scan_errors = 0
+                            
+                            # Update UI via signals
+                            self.status_signal.emit("Tag Ready")                        
+                            self.write_status_signal.emit("Tag Ready - Click Write to proceed")
+                            
+                            self._scan_last_activity = time.monotonic()
+                            
+                            # Only process if it's a new tag; a resting tag costs one GET_UID per poll
+                            if uid != self._scan_last_uid:
+                                self._scan_last_uid = uid
+                                self.post_log("New tag detected", f"UID: {uid}")
                                 
                                 # Detect tag type
                                 try:
                                     tag_type = self.nfc_reader.detect_tag_type(connection)
-                                    self.tag_type_label.setText(f"Tag Type: {tag_type}")
                                 except Exception as e:
                                     # Handle exception during tag type detection
                                     if self.debug_mode:
-                                        self.append_log("Error", f"Tag type detection failed: {str(e)}")
-                                    self.tag_type_label.setText("Tag Type: Unknown")
+                                        self.post_log("Error", f"Tag type detection failed: {str(e)}")
+                                    tag_type = "Unknown"
+                                self.tag_signal.emit({"present": True, "tag_type": tag_type})
                                 
-                                # Animate tag indicator in write tab
-                                if hasattr(self.write_tab, 'tag_indicator'):
-                                    self.animate_indicator(self.write_tab.tag_indicator)
-                                    
-                                last_activity_time = time.time()
-                                
-                                # Only process if it's a new tag
-                                if uid != last_uid:
-                                    last_uid = uid
-                                    self.append_log("New tag detected", f"UID: {uid}")
-                                    
-                                    # Read tag memory
-                                    try:
+                                # A tag that was only briefly lifted off the reader was just parsed,
+                                # unless a tag has been written since (writes run on this thread too)
+                                now = time.monotonic()
+                                cached = self._scan_uid_cache.get(uid)
+                                try:
+                                    if (cached and now - cached[0] < SCAN_UID_CACHE_TTL
+                                            and cached[0] > self.nfc_writer.last_write_time):
+                                        if cached[1]:
+                                            self.url_signal.emit(cached[1])
+                                    else:
+                                        # Read tag memory
                                         memory_data = self.nfc_reader.read_tag_memory(connection)
                                         if memory_data:
-                                            self.process_ndef_content(memory_data)
-                                    except Exception as e:
-                                        # Handle exception during tag memory reading
-                                        if self.debug_mode:
-                                            self.append_log("Error", f"Failed to read tag memory: {str(e)}")
-                        except Exception as uid_error:
-                            # Handle errors during UID reading
-                            consecutive_errors += 1
-                            if self.debug_mode:
-                                self.append_log("Error", f"Failed to read tag UID: {str(uid_error)}")
-                        
-                        # Always try to disconnect, but don't crash if it fails
-                        try:
-                            connection.disconnect()
-                        except Exception as disconnect_error:
-                            if self.debug_mode:
-                                self.append_log("Debug", f"Disconnect error: {str(disconnect_error)}")
-                except Exception as e:
-                    consecutive_errors += 1
-                    error_msg = str(e)
-                    # Only log errors that aren't common disconnection messages
-                    if not any(msg in error_msg.lower() for msg in [
-                        "card is not connected",
-                        "no smart card inserted",
-                        "card is unpowered"
-                    ]):
-                        self.append_log("Error", f"Scan error: {error_msg}")
-                    
-                    last_uid = None  # Reset UID on error
-                    self.write_tab.update_tag_status(False)  # Update status when tag is removed/error
-                
-                # Adaptive sleep time - sleep longer if we're having errors
-                sleep_time = 0.2 + (0.1 * min(consecutive_errors, 3))  # Max additional sleep of 0.3s
-                time.sleep(sleep_time)
+                                            url = self.process_ndef_content(memory_data)
+                                            self._scan_uid_cache[uid] = (now, url)
+                                            self._scan_uid_cache.move_to_end(uid)
+                                            if len(self._scan_uid_cache) > SCAN_UID_CACHE_SIZE:
+                                                self._scan_uid_cache.popitem(last=False)
+                                except Exception as e:
+                                    # Handle exception during tag memory reading
+                                    if self.debug_mode:
+                                        self.post_log("Error", f"Failed to read tag memory: {str(e)}")
+                        else:
+                            # The tag was lifted, or a held connection went stale because it was swapped
+                            self._scan_last_uid = None
+                            self.nfc_reader.release_connection()
+                    except Exception as uid_error:
+                        # Handle errors during UID reading
+                        self._scan_errors += 1
+                        self.nfc_reader.release_connection()
+                        if self.debug_mode:
+                            self.post_log("Error", f"Failed to read tag UID: {str(uid_error)}")
         except Exception as e:
-            # Catch any unhandled exceptions in the scan loop to prevent app crashes
-            self.append_log("Critical Error", f"Scan loop error: {str(e)}")
-            self.status_signal.emit(f"Status: Scanning stopped due to error: {str(e)}")
-            self.scanning = False
-            # Update UI to reflect stopped scanning
-            self.read_tab.scan_button.setText("Start Scanning")
-            self.read_tab.scan_button.setStyleSheet("")
+            self._scan_errors += 1
+            error_msg = str(e)
+            # Only log errors that aren't common disconnection messages
+            if not is_disconnect_error(error_msg):
+                self.post_log("Error", f"Scan error: {error_msg}")
+            
+            self._scan_last_uid = None  # Reset UID on error
+            self.tag_signal.emit({"present": False})  # Update status when tag is removed/error
+        
+        # Adaptive poll interval - wait longer if we're having errors
+        return 200 + 100 * min(self._scan_errors, 3)  # Max additional delay of 300ms
     
-    def process_ndef_content(self, data: List[int]):
-        """Process NDEF content and open URLs if found."""
+    def process_ndef_content(self, data: bytearray):
+        """
+        Process NDEF content and open URLs if found.
+        
+        Returns:
+            Optional[str]: The URL found on the tag, if any
+        """
+        url = None
         try:
-            url = extract_url_from_data(data, self.toHexString)
+            url = extract_url_from_data(data, self.toHexString, 4)
             if url:
-                self.append_log("URL Detected", f"Found URL: {url}")
+                self.post_log("URL Detected", f"Found URL: {url}")
                 self.url_signal.emit(url)
                 
-                # Open URL in browser in a separate thread to prevent blocking UI
-                def open_url_thread():
-                    try:
-                        if open_url_in_browser(url):
-                            self.log_signal.emit("System", "Opening URL in browser")
-                        else:
-                            self.log_signal.emit("Error", f"Failed to open URL in browser: {url}")
-                    except Exception as e:
-                        self.log_signal.emit("Error", f"Error opening URL: {str(e)}")
-                
-                # Start the thread and track it
-                url_thread = threading.Thread(target=open_url_thread, daemon=True)
-                url_thread.start()
-                self.active_threads.append(url_thread)
+                # Open the URL from the GUI thread
+                self.open_url_signal.emit(url)
                 
         except Exception as e:
-            self.append_log("Error", f"Error parsing NDEF: {str(e)}")
+            self.post_log("Error", f"Error parsing NDEF: {str(e)}")
+        return url
     
-    @pyqtSlot()
-    def check_tag_queue(self):
-        """Check for new tag data and update the GUI."""
+    @pyqtSlot(str)
+    def open_scanned_url(self, url):
+        """Open a URL read from a tag, unless it was just opened."""
+        now = time.monotonic()
+        if url == self._last_opened_url and now - self._last_opened_time < URL_REOPEN_INTERVAL:
+            return
+        self._last_opened_url = url
+        self._last_opened_time = now
+        
         try:
-            while True:
-                title, message = self.tag_queue.get_nowait()
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                self.read_tab.append_log(title, message, timestamp, self._get_title_color(title))
-        except queue.Empty:
-            pass
+            if open_url_in_browser(url):
+                self.append_log("System", "Opening URL in browser")
+            else:
+                self.append_log("Error", f"Failed to open URL in browser: {url}")
+        except Exception as e:
+            self.append_log("Error", f"Error opening URL: {str(e)}")
+    
+    def _copy_to_clipboard(self, text, label):
+        """Copy text to the clipboard and log what was copied."""
+        self._clip.setText(text)
+        self.append_log("System", f"{label} copied to clipboard")
     
     def copy_detected_url(self):
         """Copy detected URL to clipboard."""
         url = self.read_tab.url_label.text()
         if url:
-            QApplication.clipboard().setText(url)
-            self.append_log("System", "URL copied to clipboard")
+            self._copy_to_clipboard(url, "URL")
     
     def copy_log(self):
         """Copy log content to clipboard."""
-        content = self.read_tab.get_log_text()
-        QApplication.clipboard().setText(content)
-        self.append_log("System", "Log content copied to clipboard")
+        # The log view keeps at most LOG_MAX_LINES lines, so this text is bounded
+        text = self.read_tab.get_log_text()
+        if text:
+            self._copy_to_clipboard(text, "Log content")
     
     def clear_log(self):
         """Clear the log text."""
         self.read_tab.clear_log()
         self.append_log("System", "Log cleared")
     
-    def _get_title_color(self, title):
-        """Get color for log message title."""
-        colors = {
-            "Error": "#D32F2F",
-            "Debug": "#1976D2",
-            "System": "#388E3C",
-            "URL Detected": "#7B1FA2",
-            "Browser": "#F57C00",
-            "Text Record": "#00796B"
-        }
-        return colors.get(title, "#000000")
-    
     def toggle_debug_mode(self, state):
         """Toggle debug mode on/off."""
         self.debug_mode = bool(state)
+        self.nfc_reader.debug_enabled = self.debug_mode
+        self.nfc_writer.debug_enabled = self.debug_mode
         if not self.debug_mode:
             self.read_tab.clear_log()
             self.append_log("System", "Debug mode disabled")
@@ -768,7 +1068,31 @@ class NFCReaderGUI(QMainWindow):
     
     def debug_callback(self, title, message):
         """Callback for debug messages."""
-        self.log_signal.emit(title, message)
+        # Drop messages append_log would discard before they cross threads
+        if self.debug_mode or title in LOG_TITLES_ALWAYS_SHOWN:
+            self.post_log(title, message)
+    
+    def post_log(self, title, message):
+        """
+        Queue a log line from any thread for the GUI thread to append.
+        
+        Only the first line queued after a drain signals the GUI thread, so a
+        burst of debug output crosses threads once instead of once per line.
+        """
+        with self._log_queue_lock:
+            wake = not self._log_queue
+            self._log_queue.append((title, message))
+        if wake:
+            self.log_ready_signal.emit()
+    
+    @pyqtSlot()
+    def drain_log_queue(self):
+        """Append every queued worker log line."""
+        with self._log_queue_lock:
+            entries = list(self._log_queue)
+            self._log_queue.clear()
+        for title, message in entries:
+            self.append_log(title, message)
     
     def append_log(self, title, message):
         """Append formatted message to log."""
@@ -777,14 +1101,18 @@ class NFCReaderGUI(QMainWindow):
             return
         
         # Only show important messages by default
-        if not self.debug_mode and title not in ["Error", "URL Detected", "System", "Text Record"]:
+        if not self.debug_mode and title not in LOG_TITLES_ALWAYS_SHOWN:
             return
         
         try:
             # Check if the read tab still exists
             if hasattr(self, 'read_tab') and self.read_tab is not None:
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                self.read_tab.append_log(title, message, timestamp, self._get_title_color(title))
+                now = int(time.time())
+                if now != self._log_timestamp_second:
+                    self._log_timestamp_second = now
+                    self._log_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+                self.read_tab.append_log(title, message, self._log_timestamp,
+                                         LOG_TITLE_COLORS.get(title, "#000000"))
         except RuntimeError:
             # Ignore errors if the UI element has been deleted
             pass
@@ -792,6 +1120,10 @@ class NFCReaderGUI(QMainWindow):
     @pyqtSlot(str)
     def update_status_label(self, text):
         """Update the status label."""
+        # Scanning re-emits the same status on every poll; skip the repaint
+        if text == self._last_status_text:
+            return
+        self._last_status_text = text
         try:
             # Check if the read tab still exists
             if hasattr(self, 'read_tab') and self.read_tab is not None:
@@ -803,39 +1135,67 @@ class NFCReaderGUI(QMainWindow):
     @pyqtSlot(str)
     def update_write_status(self, text):
         """Update the write status label."""
-        try:
-            # Check if the write tab still exists
-            if hasattr(self, 'write_tab') and self.write_tab is not None:
-                self.write_tab.update_write_status(text)
-        except RuntimeError:
-            # Ignore errors if the UI element has been deleted
-            pass
+        self._queue_write_update('status', text)
     
     @pyqtSlot(str)
     def update_progress(self, text):
         """Update the progress label."""
-        try:
-            # Check if the write tab still exists
-            if hasattr(self, 'write_tab') and self.write_tab is not None:
-                self.write_tab.update_progress(text)
-        except RuntimeError:
-            # Ignore errors if the UI element has been deleted
-            pass
+        self._queue_write_update('progress', text)
     
     @pyqtSlot(int, int)
     def update_progress_bar(self, current, total):
         """Update the progress bar."""
+        self._queue_write_update('progress_bar', (current, total))
+    
+    def _queue_write_update(self, key, value):
+        """Record the latest value for a write tab widget and schedule a flush."""
+        self._pending_write_updates[key] = value
+        if not self.write_update_timer.isActive():
+            self.write_update_timer.start()
+    
+    def flush_write_updates(self):
+        """Apply pending write tab updates in a single repaint."""
+        updates, self._pending_write_updates = self._pending_write_updates, {}
         try:
             # Check if the write tab still exists
-            if hasattr(self, 'write_tab') and self.write_tab is not None:
-                self.write_tab.update_progress_bar(current, total)
+            if not hasattr(self, 'write_tab') or self.write_tab is None:
+                return
+            self.write_tab.setUpdatesEnabled(False)
+            try:
+                if 'status' in updates:
+                    self.write_tab.update_write_status(updates['status'])
+                if 'progress' in updates:
+                    self.write_tab.update_progress(updates['progress'])
+                if 'progress_bar' in updates:
+                    self.write_tab.update_progress_bar(*updates['progress_bar'])
+            finally:
+                self.write_tab.setUpdatesEnabled(True)
         except RuntimeError:
             # Ignore errors if the UI element has been deleted
             pass
     
+    @pyqtSlot(dict)
+    def update_tag_widgets(self, info):
+        """Update the tag status widgets from a scan result."""
+        if not info["present"]:
+            self.write_tab.update_tag_status(False)
+            return
+        
+        self.write_tab.update_tag_status(True)
+        self.tag_status.setText("Tag Present")  # Update status bar
+        self.tag_type_label.setText(f"Tag Type: {info['tag_type']}")
+        
+        # Animate tag indicator in write tab
+        if hasattr(self.write_tab, 'tag_indicator'):
+            self.animate_indicator(self.write_tab.tag_indicator)
+    
     @pyqtSlot(str)
     def update_url_label(self, text):
         """Update the URL label."""
+        # Re-presenting a cached tag re-emits the URL already shown
+        if text == self._last_url_text:
+            return
+        self._last_url_text = text
         try:
             # Check if the read tab still exists
             if hasattr(self, 'read_tab') and self.read_tab is not None:
@@ -853,7 +1213,7 @@ class NFCReaderGUI(QMainWindow):
             return
         
         # Check if URL starts with http://, https://, or www.
-        if not (text.startswith('http://') or text.startswith('https://') or text.startswith('www.')):
+        if not text.startswith(('http://', 'https://', 'www.')):
             result = QMessageBox.warning(
                 self, 
                 "URL Format Warning",
@@ -870,8 +1230,11 @@ class NFCReaderGUI(QMainWindow):
             else:
                 return
         
-        # Validate URL format
-        is_valid, normalized_url = validate_url(text)
+        # Validate URL format, reusing the result shown while typing when the text is unchanged
+        if text == self._last_validated_text:
+            is_valid, normalized_url = self._last_validation
+        else:
+            is_valid, normalized_url = validate_url(text)
         if not is_valid:
             QMessageBox.warning(self, "Warning", "The URL format appears to be invalid. Please check and try again.")
             return
@@ -888,25 +1251,26 @@ class NFCReaderGUI(QMainWindow):
         
         lock = self.write_tab.get_lock_state()
         
+        # A previous batch or copy would hold the worker until it finishes
+        self.stop_card_operations()
+        
         # Use signals to update UI elements instead of direct calls
         self.write_status_signal.emit("Ready - Please present first tag...")
         self.progress_signal.emit(f"Starting batch operation: 0/{quantity} tags written")
         
+        # Run the batch write on the card worker thread
+        if not self.submit_card_job(
+            self.nfc_writer.batch_write_tags,
+            self.nfc_reader, text, quantity, lock,
+            progress_callback=self.on_write_progress,
+            status_callback=self.on_write_status
+        ):
+            self.write_status_signal.emit("Reader busy - write not started")
+            self.progress_signal.emit("")
+            return
+        
         # Add to recent URLs
         self.write_tab.add_recent_url(text)
-        
-        # Start batch write in a separate thread
-        write_thread = threading.Thread(
-            target=self.nfc_writer.batch_write_tags,
-            args=(self.nfc_reader, text, quantity, lock),
-            kwargs={
-                'progress_callback': self.on_write_progress,
-                'status_callback': self.on_write_status
-            },
-            daemon=True
-        )
-        write_thread.start()
-        self.active_threads.append(write_thread)
     
     def on_write_progress(self, tags_written, total):
         """Callback for write progress updates."""
@@ -917,10 +1281,20 @@ class NFCReaderGUI(QMainWindow):
         """Callback for write status updates."""
         self.write_status_signal.emit(text)
     
+    def schedule_write_validation(self, text):
+        """Validate URL input once typing pauses."""
+        self._pending_validation_text = text
+        self.validation_timer.start()
+    
     def validate_write_input(self, text):
         """Validate URL input and provide feedback."""
         text = text.strip()
         
+        # Nothing to do if this text was already validated
+        if text == self._last_validated_text:
+            return
+        self._last_validated_text = text
+        
         # Update character count
         remaining = 137 - len(text)  # NTAG213 URL capacity
         self.write_tab.update_char_count(remaining)
@@ -928,7 +1302,8 @@ class NFCReaderGUI(QMainWindow):
         # Validate URL format
         is_valid = False
         if text:
-            is_valid, _ = validate_url(text)
+            self._last_validation = validate_url(text)
+            is_valid = self._last_validation[0]
         
         # Update validation label
         if is_valid:
@@ -943,8 +1318,7 @@ class NFCReaderGUI(QMainWindow):
     
     def paste_to_write_entry(self):
         """Paste clipboard content into write entry."""
-        clipboard = QApplication.clipboard()
-        text = clipboard.text().strip()
+        text = self._clip.text().strip()
         
         if text:
             self.write_tab.set_url(text)
@@ -971,20 +1345,21 @@ class NFCReaderGUI(QMainWindow):
             QMessageBox.critical(self, "Error", "Reader not connected")
             return
         
+        # A batch write or copy would hold the worker until it finishes
+        self.stop_card_operations()
+        
         # Update UI
         self.copy_tab.update_status("Status: Please present source tag to read...")
         self.copy_tab.update_source_info("Waiting for source tag...")
         self.copy_tab.enable_copy_button(False)
         
-        # Start a thread to read the source tag
-        threading.Thread(
-            target=self.nfc_copier.read_source_tag,
-            kwargs={
-                'status_callback': self.on_copy_status,
-                'tag_info_callback': self.on_tag_info
-            },
-            daemon=True
-        ).start()
+        # Read the source tag on the card worker thread
+        if not self.submit_card_job(
+            self.nfc_copier.read_source_tag,
+            status_callback=self.copy_status_signal.emit,
+            tag_info_callback=self.copy_tag_info_signal.emit
+        ):
+            self.copy_tab.update_source_info("No source tag scanned yet")
     
     def copy_to_new_tag(self):
         """Copy source tag data to new tags."""
@@ -1000,33 +1375,60 @@ class NFCReaderGUI(QMainWindow):
         quantity = self.copy_tab.get_copies_count()
         lock = self.copy_tab.get_lock_state()
         
+        # A batch write or earlier copy would hold the worker until it finishes
+        self.stop_card_operations()
+        
         # Update UI
         self.copy_tab.enable_copy_button(False)
         self.copy_tab.enable_stop_button(True)
         self.copy_tab.enable_read_button(False)
         
-        # Start copy operation in a separate thread
-        threading.Thread(
-            target=self.nfc_copier.copy_to_new_tags,
-            args=(quantity, lock),
-            kwargs={
-                'status_callback': self.on_copy_status,
-                'progress_callback': self.on_copy_progress
-            },
-            daemon=True
-        ).start()
+        # Run the copy operation on the card worker thread
+        if not self.submit_card_job(
+            self.nfc_copier.copy_to_new_tags,
+            quantity, lock,
+            status_callback=self.copy_status_signal.emit,
+            progress_callback=self.copy_progress_signal.emit
+        ):
+            self.copy_tab.enable_copy_button(True)
+            self.copy_tab.enable_stop_button(False)
+            self.copy_tab.enable_read_button(True)
     
+    def stop_card_operations(self):
+        """Ask a running batch write, copy or source tag read to return so other card jobs can run."""
+        if self.nfc_writer.writing:
+            self.nfc_writer.stop_batch_write()
+            self.write_status_signal.emit("Batch write stopped")
+        if self.nfc_copier.copying or self.nfc_copier.reading:
+            self.stop_copy_operation()
+    
+    def submit_card_job(self, func, *args, **kwargs):
+        """
+        Queue a card operation on the worker, reporting when the reader is busy.
+        
+        Returns:
+            bool: True if the operation was queued
+        """
+        if self.nfc_worker.submit(func, *args, **kwargs):
+            return True
+        self.append_log("Error", "Reader is busy - please wait for the current operation to finish")
+        self.status_bar.showMessage("Reader busy", 3000)
+        return False
+    
+    @pyqtSlot(str)
     def on_copy_status(self, text):
-        """Callback for copy status updates."""
+        """Show a copy status update sent from the worker."""
         self.copy_tab.update_status(text)
     
+    @pyqtSlot(str)
     def on_tag_info(self, text):
-        """Callback for tag info updates."""
+        """Show source tag info sent from the worker."""
         self.copy_tab.update_source_info(text)
         self.copy_tab.enable_copy_button(True)
     
+    @pyqtSlot(int, int)
     def on_copy_progress(self, current, total):
-        """Callback for copy progress updates."""
+        """Show copy progress sent from the worker."""
         self.copy_tab.update_progress(f"{current}/{total} tags written")
         self.copy_tab.update_progress_bar(current, total)
         
@@ -1054,26 +1456,34 @@ class NFCReaderGUI(QMainWindow):
         self.copy_tab.enable_copy_button(True)
         self.copy_tab.enable_read_button(True)
 
-    def cleanup_threads(self):
-        """Clean up completed threads to prevent memory leaks."""
-        # Remove threads that have completed
-        self.active_threads = [t for t in self.active_threads if t.is_alive()]
-        
     def closeEvent(self, event):
         """Handle window close event to clean up resources."""
         # Stop scanning if active
         if self.scanning:
             self.toggle_scanning(False)
         
+        # Let any running batch write or copy operation return so the worker can finish
+        self.stop_card_operations()
+        
         # Stop all timers
         self.check_reader_timer.stop()
-        self.queue_timer.stop()
-        self.thread_cleanup_timer.stop()
+        if self.reader_monitor:
+            try:
+                self.reader_monitor.deleteObserver(self.reader_observer)
+            except Exception:
+                pass
         
-        # Wait for active threads to finish (with timeout)
-        for thread in self.active_threads:
-            if thread.is_alive():
-                thread.join(0.5)  # Wait up to 0.5 seconds for each thread
+        # Stop the card worker once its current operation returns
+        if not self.nfc_worker.stop():
+            # Still inside a card operation: finish closing once the worker thread has exited
+            # rather than destroying a running QThread
+            if not self._close_pending:
+                self._close_pending = True
+                self.nfc_worker.worker_thread.finished.connect(self.close)
+            if not self.nfc_worker.worker_thread.isFinished():
+                self.hide()
+                event.ignore()
+                return
         
         # Let the event propagate
         super().closeEvent(event)
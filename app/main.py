@@ -6,6 +6,7 @@ Main entry point for the NFC Reader/Writer application v3.5.
 import sys
 import traceback
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtGui import QFont
 from app.gui import NFCReaderGUI
 
 def exception_handler(exc_type, exc_value, exc_traceback):
@@ -33,6 +34,13 @@ def main():
     sys.excepthook = exception_handler
     
     app = QApplication(sys.argv)
+    
+    # Resolve the UI font once for the whole application
+    font = QFont()
+    font.setFamilies(["Ubuntu", "Segoe UI"])
+    font.setPointSize(10)
+    app.setFont(font)
+    
     window = NFCReaderGUI()
     window.show()
     sys.exit(app.exec())
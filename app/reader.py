@@ -2,10 +2,86 @@
 NFC Reader functionality for the NFC Reader/Writer application.
 """
 
+import re
+import threading
 import time
+from contextlib import contextmanager
 from typing import List, Tuple, Optional, Any
 
-from app.utils import GET_UID, READ_PAGE, get_reader_specific_commands
+from app.utils import (GET_UID, READ_PAGE, MAX_READ_LENGTH, FAST_READ, FAST_READ_MAX_PAGES,
+                       get_reader_specific_commands)
+
+# Time a newly presented card must stay put before connecting (seconds)
+_CARD_SETTLE_TIME = 0.01
+
+# How long a PC/SC reader enumeration is reused before listing readers again (seconds)
+_READERS_CACHE_TTL = 1.5
+
+# Known NFC reader models as (lowercase match string, display name), checked in order
+_READER_MODELS = (
+    ("acr1252", "ACR1252U"),
+    ("acr122", "ACR122U"),
+    ("acs acr122", "ACR122U"),  # Alternative naming for ACR122U
+    ("acs acr", "ACS Reader"),  # More specific ACS match
+    ("scm microsystems", "SCM Reader"),
+    ("omnikey", "HID Omnikey"),
+    ("sony", "Sony RC-S380"),
+    ("pn53", "PN532"),
+    ("usb reader", "Generic USB Reader"),  # For generic readers
+)
+
+# Known non-NFC readers to ignore
+_IGNORED_READERS = (
+    "Yubico",
+    "YubiKey",
+    "Smart Card Reader",  # Generic smart card readers
+    "USB Smart Card Reader",
+    "Common Access Card",
+    "CAC Reader",
+    "PIV Reader",
+    "EMV Reader",
+)
+_IGNORED_READERS_RE = re.compile("|".join(map(re.escape, _IGNORED_READERS)))
+_IGNORED_READERS_CI_RE = re.compile(_IGNORED_READERS_RE.pattern, re.IGNORECASE)
+
+# First byte that is not NULL TLV padding, so padding runs are skipped in one scan
+_TLV_START_RE = re.compile(rb'[^\x00]')
+
+def _ndef_terminator_end(data: bytearray, pos: int) -> int:
+    """
+    Walk the TLV blocks in tag data to the Terminator TLV.
+    
+    TLV values are skipped by their length, so a 0xFE byte inside a record
+    is never mistaken for the terminator.
+    
+    Args:
+        data: Tag memory read so far
+        pos: Offset of the first TLV (page 4)
+        
+    Returns:
+        int: Offset just past the 0xFE terminator, or -1 if it has not been read yet
+    """
+    n = len(data)
+    while pos < n:
+        tlv_type = data[pos]
+        if tlv_type == 0x00:  # NULL TLVs have no length field; blank tags are nothing but these
+            match = _TLV_START_RE.search(data, pos)
+            if match is None:
+                break
+            pos = match.start()
+            tlv_type = data[pos]
+        if tlv_type == 0xFE:
+            return pos + 1
+        if pos + 1 >= n:
+            break
+        length = data[pos + 1]
+        if length == 0xFF:  # Three-byte length format
+            if pos + 3 >= n:
+                break
+            pos += 4 + ((data[pos + 2] << 8) | data[pos + 3])
+        else:
+            pos += 2 + length
+    return -1
 
 class NFCReader:
     """Class to handle NFC reader operations."""
@@ -22,9 +98,26 @@ class NFCReader:
         self.readers_func = readers_func
         self.toHexString = toHexString_func
         self.debug_callback = debug_callback
+        self.debug_enabled = False  # Debug-level messages are only built and sent when enabled
         self.reader = None
         self.tag_type = None
         self.last_connection_time = 0
+        self._last_readers_key = None
+        self._last_find_result = None
+        self._readers_cache = None
+        self._readers_cache_time = 0.0
+        self._read_block_pages = None
+        self._fast_read_supported = None  # Whether the reader passes FAST_READ through to the card
+        self._fast_read_card_nak = False  # The connected card NAKed FAST_READ; cleared with the connection
+        self._protocol_order = None
+        self._scard_context = None
+        self._card_state = None
+        self._card_state_reader = None
+        self._card_state_change_time = 0
+        self._held_connection = None
+        self._held_since = 0
+        self._read_apdu = READ_PAGE + [0x00, 0x04]
+        self._fast_read_apdu = FAST_READ + [0x00, 0x00]
     
     def find_reader(self):
         """
@@ -34,47 +127,29 @@ class NFCReader:
             Tuple[bool, str]: (success, message)
         """
         try:
-            available_readers = self.readers_func()
+            available_readers = self._list_readers()
+            
+            # Skip re-classification while the connected reader list is unchanged
+            readers_key = tuple(str(r) for r in available_readers)
+            if readers_key == self._last_readers_key and self.reader is not None:
+                return self._last_find_result
+            self._last_readers_key = readers_key
+            self.release_connection()
             self.reader = None
+            self._read_block_pages = None
+            self._fast_read_supported = None
+            self._protocol_order = None
             
-            for r in available_readers:
-                # Get reader details
-                reader_str = str(r)
-                reader_id = reader_str.split(" ")[0]
-                
-                # Known NFC reader models and their capabilities
-                reader_models = {
-                    "ACR1252": "ACR1252U",
-                    "ACR122": "ACR122U", 
-                    "ACS ACR122": "ACR122U",  # Alternative naming for ACR122U
-                    "ACS ACR": "ACS Reader",  # More specific ACS match
-                    "SCM Microsystems": "SCM Reader",
-                    "OMNIKEY": "HID Omnikey",
-                    "Sony": "Sony RC-S380",
-                    "PN53": "PN532",
-                    "USB Reader": "Generic USB Reader"  # For generic readers
-                }
-                
-                # List of known non-NFC readers to ignore
-                ignored_readers = [
-                    "Yubico",
-                    "YubiKey",
-                    "Smart Card Reader",  # Generic smart card readers
-                    "USB Smart Card Reader",
-                    "Common Access Card",
-                    "CAC Reader",
-                    "PIV Reader",
-                    "EMV Reader"
-                ]
-                
+            for r, reader_str in zip(available_readers, readers_key):
                 # Check if this is a reader we should ignore
-                if any(ignored in reader_str for ignored in ignored_readers):
+                if _IGNORED_READERS_RE.search(reader_str):
                     continue
                 
-                # Find matching reader model
+                # Find matching reader model (case-insensitive matching)
+                reader_str_lower = reader_str.lower()
                 reader_model = None
-                for model_id, model_name in reader_models.items():
-                    if model_id.lower() in reader_str.lower():  # Case-insensitive matching
+                for model_id, model_name in _READER_MODELS:
+                    if model_id in reader_str_lower:
                         reader_model = model_name
                         break
                 
@@ -82,38 +157,143 @@ class NFCReader:
                 if reader_model is None:
                     # If no specific model is identified but it doesn't match ignored readers,
                     # try to use it as a generic reader
-                    if not any(ignored.lower() in reader_str.lower() for ignored in ignored_readers):
+                    if not _IGNORED_READERS_CI_RE.search(reader_str):
                         reader_model = "Generic NFC Reader"
                     else:
                         continue
                 
                 self.reader = r
-                return True, f"{reader_model} connected ({reader_id})"
+                reader_id = reader_str.partition(" ")[0]
+                self._last_find_result = (True, f"{reader_model} connected ({reader_id})")
+                return self._last_find_result
             
             return False, "No NFC reader found"
         except Exception as e:
+            self._last_readers_key = None
+            self._readers_cache = None
             return False, f"Error - {str(e)}"
     
-    def connect_with_retry(self) -> Tuple[Any, bool]:
+    def _list_readers(self):
+        """Enumerate PC/SC readers, reusing a result younger than the cache TTL."""
+        now = time.monotonic()
+        if self._readers_cache is None or now - self._readers_cache_time >= _READERS_CACHE_TTL:
+            self._readers_cache = self.readers_func()
+            self._readers_cache_time = now
+        return self._readers_cache
+    
+    def invalidate_readers(self):
+        """Make the next find_reader enumerate readers again (e.g. after a hot-plug event)."""
+        self._readers_cache = None
+    
+    def wait_for_card(self, timeout_ms: int = 500) -> bool:
+        """
+        Check card presence with SCardGetStatusChange instead of a failing connect.
+        
+        While the reader is known to be empty this blocks in the PC/SC resource
+        manager until a card arrives or the timeout elapses, so the idle loop no
+        longer raises a NoCardException on every poll.
+        
+        Args:
+            timeout_ms: Maximum time to wait for a card while the reader is empty
+            
+        Returns:
+            bool: True if a card is present (or presence cannot be determined)
+        """
+        if not self.reader:
+            return False
+        
+        try:
+            from smartcard.scard import (SCardEstablishContext, SCardReleaseContext,
+                                         SCardGetStatusChange, SCARD_SCOPE_USER,
+                                         SCARD_S_SUCCESS, SCARD_E_TIMEOUT,
+                                         SCARD_STATE_UNAWARE, SCARD_STATE_PRESENT,
+                                         SCARD_STATE_CHANGED)
+        except ImportError:
+            return True
+        
+        reader_name = str(self.reader)
+        if reader_name != self._card_state_reader:
+            self._card_state_reader = reader_name
+            self._card_state = None
+        
+        try:
+            if self._scard_context is None:
+                hresult, context = SCardEstablishContext(SCARD_SCOPE_USER)
+                if hresult != SCARD_S_SUCCESS:
+                    return True
+                self._scard_context = context
+            
+            # A present card is re-queried immediately; an empty reader waits for a change
+            if self._card_state is None or self._card_state & SCARD_STATE_PRESENT:
+                current_state, timeout = SCARD_STATE_UNAWARE, 0
+            else:
+                current_state, timeout = self._card_state, timeout_ms
+            
+            hresult, states = SCardGetStatusChange(
+                self._scard_context, timeout, [(reader_name, current_state)])
+            if hresult == SCARD_E_TIMEOUT:
+                return False
+            if hresult != SCARD_S_SUCCESS:
+                # Context may be stale (e.g. service restart); rebuild it next time
+                try:
+                    SCardReleaseContext(self._scard_context)
+                except Exception:
+                    pass
+                self._scard_context = None
+                self._card_state = None
+                return True
+            
+            _, event_state, _ = states[0]
+            present = bool(event_state & SCARD_STATE_PRESENT)
+            if self._card_state is None or present != bool(self._card_state & SCARD_STATE_PRESENT):
+                self._card_state_change_time = time.monotonic()
+            self._card_state = event_state & ~SCARD_STATE_CHANGED
+            return present
+        except Exception as e:
+            if self.debug_enabled and self.debug_callback:
+                self.debug_callback("Debug", f"Card status check failed: {str(e)}")
+            self._scard_context = None
+            self._card_state = None
+            return True
+    
+    def connect_with_retry(self, stop_event: Optional[threading.Event] = None) -> Tuple[Any, bool]:
         """
         Try to connect to the card with retries.
         Enhanced to better support different reader models including ACR122U.
         
+        Args:
+            stop_event: Event that, once set, abandons the remaining retries
+        
         Returns:
             Tuple[Any, bool]: (connection, success)
         """
+        # A connection kept open by card_connection would otherwise share the card
+        self.release_connection()
+        
         if not self.reader:
             return None, False
+        
+        # Skip the connect/exception path entirely while no card is present
+        if not self.wait_for_card():
+            return None, False
 
         # Get reader model to adjust connection strategy
         reader_str = str(self.reader)
         is_acr122u = "ACR122" in reader_str
             
-        current_time = time.time()
-        # ACR122U may need a slightly longer debounce time
-        min_debounce = 0.2 if is_acr122u else 0.15  
-        if current_time - self.last_connection_time < min_debounce:
-            return None, False
+        current_time = time.monotonic()
+        if self._card_state_change_time > self.last_connection_time:
+            # A card just arrived: connect as soon as it has been stable for the settle time
+            settle = self._card_state_change_time + _CARD_SETTLE_TIME - current_time
+            if settle > 0:
+                time.sleep(settle)
+                current_time = time.monotonic()
+        else:
+            # Same card still present: throttle re-polling it
+            # ACR122U may need a slightly longer debounce time
+            min_debounce = 0.2 if is_acr122u else 0.15  
+            if current_time - self.last_connection_time < min_debounce:
+                return None, False
             
         self.last_connection_time = current_time
         
@@ -128,6 +308,20 @@ class NFCReader:
         # ACR122U sometimes needs more retries
         max_attempts = 7 if is_acr122u else 6  
         
+        # Fast path: one attempt, without backoff, with the protocol that last worked on this reader
+        if self._protocol_order is not None:
+            protocol = self._protocol_order[0]
+            try:
+                if self._connect_protocol(connection, protocol):
+                    return connection, True
+            except Exception as e:
+                if self.debug_enabled and self.debug_callback:
+                    self.debug_callback("Debug", f"Connection attempt failed with {protocol}: {str(e)}")
+            try:
+                connection.disconnect()
+            except Exception:
+                pass
+        
         # Prioritize protocols based on reader model
         # ACR122U tends to work better with T0 protocol first
         protocols = ['T0', 'T1', 'T=0', 'T=1', None] if is_acr122u else ['T1', 'T0', 'T=1', 'T=0', None]
@@ -135,50 +329,146 @@ class NFCReader:
         for attempt in range(max_attempts):
             for protocol in protocols:
                 try:
-                    if protocol:
-                        if protocol.startswith('T='):
-                            connection.connect(protocol=protocol)
-                        else:
-                            connection.connect(cardProtocol=protocol)
-                    else:
-                        connection.connect()
-                        
-                    # Verify connection with GET_UID command
-                    try:
-                        # Add timeout handling for verification
-                        max_verify_retries = 2
-                        for verify_retry in range(max_verify_retries):
-                            try:
-                                response, sw1, sw2 = connection.transmit(GET_UID)
-                                if sw1 == 0x90:
-                                    if self.debug_callback:
-                                        self.debug_callback("Debug", f"Connected with protocol: {protocol}")
-                                    return connection, True
-                                break  # If we get a response but not 0x90, no need to retry
-                            except Exception as verify_error:
-                                if verify_retry == max_verify_retries - 1:
-                                    # Last retry failed, continue to next protocol
-                                    break
-                                time.sleep(0.1)
-                    except:
-                        # If UID check fails, connection might not be stable
-                        continue
-                        
+                    if self._connect_protocol(connection, protocol):
+                        # Try this protocol first on later connects
+                        self._protocol_order = [protocol] + [p for p in protocols if p != protocol]
+                        return connection, True
                 except Exception as e:
-                    if attempt == max_attempts - 1 and self.debug_callback:  # Only log on last attempt
+                    if attempt == max_attempts - 1 and self.debug_enabled and self.debug_callback:  # Only log on last attempt
                         self.debug_callback("Debug", f"Connection attempt failed with {protocol}: {str(e)}")
-                    # ACR122U may need slightly longer delays between attempts
-                    time.sleep((0.2 if is_acr122u else 0.15) * (attempt + 1))  
                     
                 try:
                     connection.disconnect()
-                except:
+                except Exception:
                     pass
+            
+            if attempt == max_attempts - 1:
+                break
+            # Back off between rounds of protocols, doubling up to a short cap
+            # ACR122U may need slightly longer delays between attempts
+            delay = min((0.03 if is_acr122u else 0.02) * (2 ** attempt), 0.1)
+            if stop_event is None:
+                time.sleep(delay)
+            elif stop_event.wait(delay):
+                return None, False
                     
-        if self.debug_callback:
+        if self.debug_enabled and self.debug_callback:
             self.debug_callback("Debug", "All connection attempts failed")
         return None, False
     
+    def _connect_protocol(self, connection, protocol) -> bool:
+        """
+        Connect with one protocol and verify the card answers GET_UID.
+        
+        Args:
+            connection: Card connection to connect
+            protocol: Protocol name ('T0', 'T1', 'T=0', 'T=1') or None for the default
+            
+        Returns:
+            bool: True if connected and verified; raises if the connect itself fails
+        """
+        if protocol:
+            if protocol.startswith('T='):
+                connection.connect(protocol=protocol)
+            else:
+                connection.connect(cardProtocol=protocol)
+        else:
+            connection.connect()
+            
+        # Verify connection with GET_UID command
+        max_verify_retries = 2
+        for verify_retry in range(max_verify_retries):
+            try:
+                response, sw1, sw2 = connection.transmit(GET_UID)
+                if sw1 == 0x90:
+                    if self.debug_enabled and self.debug_callback:
+                        self.debug_callback("Debug", f"Connected with protocol: {protocol}")
+                    return True
+                return False  # If we get a response but not 0x90, no need to retry
+            except Exception:
+                if verify_retry == max_verify_retries - 1:
+                    # Last retry failed, continue to next protocol
+                    return False
+                time.sleep(0.1)
+        return False
+    
+    @contextmanager
+    def card_connection(self, keep_alive: bool = False, stop_event: Optional[threading.Event] = None):
+        """
+        Connect to the presented card for the duration of a with block.
+        
+        The connection is disconnected when the block exits, including when it
+        raises. With keep_alive the connection is instead kept open after a
+        clean exit and reused by the next keep_alive block, for as long as the
+        same card stays on the reader, which skips protocol negotiation on
+        every poll.
+        
+        Args:
+            keep_alive: Keep the connection open for the next keep_alive block
+            stop_event: Event that, once set, abandons connection retries
+        
+        Yields:
+            The card connection, or None if no card could be connected
+        """
+        connection = self._held_connection
+        if connection is not None:
+            # Drop the held connection if the card was lifted (or swapped) since it was opened
+            if not self.wait_for_card() or self._card_state_change_time > self._held_since:
+                self.release_connection()
+                connection = None
+        
+        if connection is None:
+            connection, connected = self.connect_with_retry(stop_event)
+            if not connected:
+                yield None
+                return
+            self._held_since = time.monotonic()
+        
+        # Registered while the block runs so release_connection() inside it drops the connection
+        self._held_connection = connection
+        try:
+            yield connection
+        except BaseException:
+            self.release_connection()
+            raise
+        if not keep_alive:
+            self.release_connection()
+    
+    def release_connection(self):
+        """Disconnect the connection kept open by card_connection, if any."""
+        # Every new card connection starts here (connect_with_retry releases first)
+        self._fast_read_card_nak = False
+        connection, self._held_connection = self._held_connection, None
+        if connection is not None:
+            self._disconnect(connection)
+    
+    def _reselect(self, connection) -> bool:
+        """
+        Reconnect a connection so the reader selects the card again, e.g. after a NAK halted it.
+        
+        Args:
+            connection: Card connection to reconnect
+            
+        Returns:
+            bool: True if the card answered again
+        """
+        self._disconnect(connection)
+        protocol = self._protocol_order[0] if self._protocol_order else None
+        try:
+            return self._connect_protocol(connection, protocol)
+        except Exception as e:
+            if self.debug_enabled and self.debug_callback:
+                self.debug_callback("Debug", f"Reselect failed: {str(e)}")
+            return False
+    
+    def _disconnect(self, connection):
+        """Disconnect a card connection, ignoring errors."""
+        try:
+            connection.disconnect()
+        except Exception as e:
+            if self.debug_enabled and self.debug_callback:
+                self.debug_callback("Debug", f"Disconnect error: {str(e)}")
+    
     def detect_tag_type(self, connection) -> str:
         """
         Detect the NFC tag type based on memory size and capabilities.
@@ -205,7 +495,7 @@ class NFCReader:
             
             # Try reading page 40 (just beyond NTAG213)
             try:
-                read_cmd = commands['READ_PAGE'] + [40, 0x04]
+                read_cmd = self._read_command(commands, 40, 0x04)
                 response, sw1, sw2 = connection.transmit(read_cmd)
                 if sw1 != 0x90:
                     self.tag_type = "NTAG213"
@@ -216,7 +506,7 @@ class NFCReader:
                 return "NTAG215/216"
             except Exception as e:
                 # If reading page 40 fails with an exception, assume it's NTAG213
-                if self.debug_callback:
+                if self.debug_enabled and self.debug_callback:
                     self.debug_callback("Debug", f"Error reading page 40: {str(e)}, assuming NTAG213")
                 self.tag_type = "NTAG213"
                 return "NTAG213"
@@ -226,7 +516,100 @@ class NFCReader:
             self.tag_type = "Unknown"
             return "Unknown"
     
-    def read_tag_memory(self, connection) -> List[int]:
+    def _read_command(self, commands: dict, page: int, length: int) -> List[int]:
+        """
+        Fill the reusable READ BINARY APDU for a page and length.
+        
+        pyscard only accepts lists for transmit, so one list is kept and
+        overwritten in place rather than building a new one for every read.
+        
+        Args:
+            commands: Reader-specific command set
+            page: Page to read
+            length: Number of bytes to read
+            
+        Returns:
+            List[int]: The READ BINARY command
+        """
+        apdu = self._read_apdu
+        apdu[:3] = commands['READ_PAGE']
+        apdu[3] = page
+        apdu[4] = length
+        return apdu
+    
+    def read_pages(self, connection, commands: dict, page: int, max_pages: int) -> Tuple[List[int], int, int]:
+        """
+        Read up to max_pages pages starting at page with as few APDUs as possible.
+        
+        FAST_READ is tried first and returns a whole range of pages in one APDU.
+        It is dropped for the reader only when the reader rejects the APDU, and for
+        the current card when the card NAKs it (e.g. an Ultralight), after which the
+        card is selected again since a NAK leaves it halted. Otherwise the first
+        multi-page READ BINARY probes whether the reader accepts a larger Le;
+        readers that reject it fall back to single 4-byte page reads.
+        A 6Cxx answer (wrong Le) is retried once with the length given in SW2.
+        
+        Args:
+            connection: Active card connection
+            commands: Reader-specific command set
+            page: First page to read
+            max_pages: Maximum number of pages to return
+            
+        Returns:
+            Tuple[List[int], int, int]: (data, sw1, sw2) where data is a whole number of pages
+        """
+        if (self._fast_read_supported is not False and max_pages > 1
+                and not self._fast_read_card_nak):
+            pages = min(max_pages, FAST_READ_MAX_PAGES)
+            apdu = self._fast_read_apdu
+            apdu[-2] = page
+            apdu[-1] = page + pages - 1
+            try:
+                response, sw1, sw2 = connection.transmit(apdu)
+            except Exception:
+                # Transport error (e.g. the card was lifted): says nothing about FAST_READ support
+                response, sw1, sw2 = None, 0x6F, 0x00
+            if response is not None:
+                # Direct transmit responses are prefixed with D5 43 and the PN53x status byte
+                if sw1 == 0x90 and response[:2] == [0xD5, 0x43] and len(response) > 2:
+                    self._fast_read_supported = True
+                    if response[2] == 0x00 and len(response) == 3 + pages * 4:
+                        return response[3:], sw1, sw2
+                    # The card NAKed or the RF exchange failed: use READ BINARY for this card
+                    if self.debug_enabled and self.debug_callback:
+                        self.debug_callback("Debug", f"FAST_READ failed on this tag (status {response[2]:02X}), using READ BINARY")
+                    self._fast_read_card_nak = True
+                    if response[2] != 0x00:
+                        self._reselect(connection)
+                elif self._fast_read_supported is None:
+                    if self.debug_enabled and self.debug_callback:
+                        self.debug_callback("Debug", "FAST_READ not supported by reader, using READ BINARY")
+                    self._fast_read_supported = False
+        
+        pages = min(max_pages, self._read_block_pages or MAX_READ_LENGTH // 4)
+        if pages > 1:
+            response, sw1, sw2 = connection.transmit(self._read_command(commands, page, pages * 4))
+            if sw1 == 0x90 and len(response) == pages * 4:
+                if self._read_block_pages is None:
+                    self._read_block_pages = MAX_READ_LENGTH // 4
+                return response, sw1, sw2
+            if sw1 == 0x6C and 4 < sw2 < pages * 4 and sw2 % 4 == 0:
+                # Wrong Le: SW2 is how many bytes can be read here (e.g. near the end of memory)
+                response, sw1, sw2 = connection.transmit(self._read_command(commands, page, sw2))
+                if sw1 == 0x90 and response and len(response) % 4 == 0:
+                    if self._read_block_pages is None:
+                        self._read_block_pages = len(response) // 4
+                    return response, sw1, sw2
+            if self._read_block_pages is None:
+                if self.debug_enabled and self.debug_callback:
+                    self.debug_callback("Debug", "Multi-page read not supported, using single page reads")
+                self._read_block_pages = 1
+        
+        # Single page read (also used to locate the exact end of readable memory)
+        response, sw1, sw2 = connection.transmit(self._read_command(commands, page, 0x04))
+        return response[:4], sw1, sw2
+    
+    def read_tag_memory(self, connection) -> bytearray:
         """
         Read NTAG213 memory pages.
         Enhanced for better compatibility with different reader models.
@@ -235,9 +618,9 @@ class NFCReader:
             connection: Active card connection
             
         Returns:
-            List[int]: Raw tag data
+            bytearray: Raw tag data
         """
-        all_data = []
+        all_data = bytearray()
         
         # Get reader model to adjust reading strategy
         reader_str = str(self.reader)
@@ -250,11 +633,11 @@ class NFCReader:
             if sw1 != 0x90:
                 if self.debug_callback:
                     self.debug_callback("Error", f"Tag presence check failed: SW1={sw1:02X} SW2={sw2:02X}")
-                return []
+                return bytearray()
         except Exception as e:
             if self.debug_callback:
                 self.debug_callback("Error", f"UID check failed: {str(e)}")
-            return []
+            return bytearray()
             
         # ACR122U sometimes needs a small delay after UID check
         if is_acr122u:
@@ -262,21 +645,21 @@ class NFCReader:
             
         # Read capability container (CC) first
         try:
-            cc_cmd = commands['READ_PAGE'] + [3, 0x04]
+            cc_cmd = self._read_command(commands, 3, 0x04)
             response, sw1, sw2 = connection.transmit(cc_cmd)
             if sw1 == 0x90:
-                if self.debug_callback:
-                    self.debug_callback("Debug", f"CC: {self.toHexString(response)}")
+                if self.debug_enabled and self.debug_callback:
+                    self.debug_callback("Debug", f"CC: {bytes(response).hex(' ').upper()}")
                 # Add CC data to all_data
                 all_data.extend(response)
             else:
                 if self.debug_callback:
                     self.debug_callback("Error", f"CC read failed: SW1={sw1:02X} SW2={sw2:02X}")
-                return []
+                return bytearray()
         except Exception as e:
             if self.debug_callback:
                 self.debug_callback("Error", f"CC read error: {str(e)}")
-            return []
+            return bytearray()
 
         # ACR122U sometimes needs a small delay after CC read
         if is_acr122u:
@@ -289,39 +672,36 @@ class NFCReader:
         if tag_type == "NTAG215/216":
             max_page = 130 if not is_acr122u else 80  # Limit for ACR122U to avoid timeouts
         
-        # Read data pages
-        found_terminator = False
-        for page in range(4, max_page):
+        # Read data pages, several per APDU when the reader supports it
+        page = 4
+        while page < max_page:
             try:
                 # Add small delay between reads for ACR122U
                 if is_acr122u and page > 4:
                     time.sleep(0.02)
                     
-                read_cmd = commands['READ_PAGE'] + [page, 0x04]  # Read 4 bytes
-                response, sw1, sw2 = connection.transmit(read_cmd)
+                response, sw1, sw2 = self.read_pages(connection, commands, page, max_page - page)
                 
-                if sw1 == 0x90:
-                    all_data.extend(response)
-                    if self.debug_callback:
-                        self.debug_callback("Debug", f"Page {page}: {self.toHexString(response)}")
-                    
-                    # Check for end of NDEF message (0xFE terminator)
-                    if 0xFE in response:
-                        found_terminator = True
-                        if self.debug_callback:
-                            self.debug_callback("Debug", f"Found NDEF terminator in page {page}")
-                        # Continue reading until the end of this page to ensure we get all data
-                        continue
-                        
-                    # If we've already found the terminator and this page is all zeros, we can stop
-                    if found_terminator and all(b == 0 for b in response):
-                        if self.debug_callback:
-                            self.debug_callback("Debug", f"Found all zeros after terminator in page {page}, stopping read")
-                        break
-                else:
-                    if self.debug_callback:
+                if sw1 != 0x90:
+                    if self.debug_enabled and self.debug_callback:
                         self.debug_callback("Debug", f"Read stopped at page {page}: SW1={sw1:02X} SW2={sw2:02X}")
                     break
+                if not response:
+                    break
+                
+                all_data.extend(response)
+                if self.debug_enabled and self.debug_callback:
+                    for offset in range(0, len(response), 4):
+                        self.debug_callback("Debug", f"Page {page + offset // 4}: {bytes(response[offset:offset + 4]).hex(' ').upper()}")
+                page += len(response) // 4
+                
+                # Stop at the end of the page holding the NDEF terminator (data starts with the CC page)
+                end = _ndef_terminator_end(all_data, 4)
+                if end != -1:
+                    del all_data[(end + 3) // 4 * 4:]
+                    if self.debug_enabled and self.debug_callback:
+                        self.debug_callback("Debug", f"Found NDEF terminator in page {3 + (end - 1) // 4}, stopping read")
+                    break
                     
             except Exception as e:
                 if self.debug_callback:
@@ -333,7 +713,7 @@ class NFCReader:
             
         return all_data
     
-    def read_tag_memory_full(self, connection) -> List[int]:
+    def read_tag_memory_full(self, connection) -> bytearray:
         """
         Read NTAG213/215/216 memory pages with extended capacity for longer URLs.
         Enhanced for better compatibility with different reader models.
@@ -342,9 +722,9 @@ class NFCReader:
             connection: Active card connection
             
         Returns:
-            List[int]: Raw tag data
+            bytearray: Raw tag data
         """
-        all_data = []
+        all_data = bytearray()
         
         # Get reader model to adjust reading strategy
         reader_str = str(self.reader)
@@ -357,11 +737,11 @@ class NFCReader:
             if sw1 != 0x90:
                 if self.debug_callback:
                     self.debug_callback("Error", f"Tag presence check failed: SW1={sw1:02X} SW2={sw2:02X}")
-                return []
+                return bytearray()
         except Exception as e:
             if self.debug_callback:
                 self.debug_callback("Error", f"UID check failed: {str(e)}")
-            return []
+            return bytearray()
             
         # ACR122U sometimes needs a small delay after UID check
         if is_acr122u:
@@ -369,19 +749,19 @@ class NFCReader:
             
         # Read capability container (CC) first
         try:
-            cc_cmd = commands['READ_PAGE'] + [3, 0x04]
+            cc_cmd = self._read_command(commands, 3, 0x04)
             response, sw1, sw2 = connection.transmit(cc_cmd)
             if sw1 == 0x90:
-                if self.debug_callback:
-                    self.debug_callback("Debug", f"CC: {self.toHexString(response)}")
+                if self.debug_enabled and self.debug_callback:
+                    self.debug_callback("Debug", f"CC: {bytes(response).hex(' ').upper()}")
             else:
                 if self.debug_callback:
                     self.debug_callback("Error", f"CC read failed: SW1={sw1:02X} SW2={sw2:02X}")
-                return []
+                return bytearray()
         except Exception as e:
             if self.debug_callback:
                 self.debug_callback("Error", f"CC read error: {str(e)}")
-            return []
+            return bytearray()
             
         # ACR122U sometimes needs a small delay after CC read
         if is_acr122u:
@@ -394,24 +774,30 @@ class NFCReader:
         # We'll try to read up to page 129 (NTAG215) to support longer URLs,
         # but use a smaller range for ACR122U to avoid timeouts
         max_page = 80 if is_acr122u else 130
-        for page in range(4, max_page):
+        page = 4
+        while page < max_page:
             try:
-                read_cmd = commands['READ_PAGE'] + [page, 0x04]  # Read 4 bytes
-                response, sw1, sw2 = connection.transmit(read_cmd)
+                response, sw1, sw2 = self.read_pages(connection, commands, page, max_page - page)
                 
-                if sw1 == 0x90:
-                    all_data.extend(response)
-                    if self.debug_callback:
-                        self.debug_callback("Debug", f"Page {page}: {self.toHexString(response)}")
-                else:
+                if sw1 != 0x90:
                     # If we get an error, we've likely reached the end of the tag's memory
-                    if self.debug_callback:
+                    if self.debug_enabled and self.debug_callback:
                         self.debug_callback("Debug", f"Read stopped at page {page}: SW1={sw1:02X} SW2={sw2:02X}")
                     break
-                    
-                # Check for end of NDEF message
-                if len(response) >= 4 and response[0] == 0xFE:
-                    if self.debug_callback:
+                if not response:
+                    break
+                
+                all_data.extend(response)
+                if self.debug_enabled and self.debug_callback:
+                    for offset in range(0, len(response), 4):
+                        self.debug_callback("Debug", f"Page {page + offset // 4}: {bytes(response[offset:offset + 4]).hex(' ').upper()}")
+                page += len(response) // 4
+                
+                # Stop at the end of the page holding the NDEF terminator (data starts at page 4)
+                end = _ndef_terminator_end(all_data, 0)
+                if end != -1:
+                    del all_data[(end + 3) // 4 * 4:]
+                    if self.debug_enabled and self.debug_callback:
                         self.debug_callback("Debug", "Found NDEF terminator, stopping read")
                     break
                     
@@ -440,7 +826,8 @@ class NFCReader:
             commands = get_reader_specific_commands(reader_str)
             response, sw1, sw2 = connection.transmit(commands['GET_UID'])
             if sw1 == 0x90:
-                return self.toHexString(response)
+                # Same 'AA BB CC' format as toHexString, formatted in C on every scan poll
+                return bytes(response).hex(' ').upper()
             return None
         except Exception:
             return None
\ No newline at end of file
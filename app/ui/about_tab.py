@@ -2,11 +2,63 @@
 About Tab UI components for the NFC Reader/Writer application.
 """
 
+from pathlib import Path
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QTextEdit, QGroupBox)
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap, QColor
 
+# User manual shown in the About tab
+MANUAL_PATH = Path(__file__).with_name("manual.html")
+
+# Changelog shown in the About tab
+CHANGELOG_HTML = """
+    <style>
+        h4 { color: #1976d2; margin-top: 10px; margin-bottom: 5px; }
+        ul { margin-left: 20px; line-height: 1.4; }
+        li { margin-bottom: 6px; }
+        .new { color: #2e7d32; }
+        .fix { color: #d32f2f; }
+        .improve { color: #1976d2; }
+    </style>
+    
+    <h4>Version 3.5 (February 2025)</h4>
+    <ul>
+        <li><span class='new'>NEW:</span> NFC Tag Type Detection</li>
+        <li><span class='new'>NEW:</span> Visual feedback animations for tag detection</li>
+        <li><span class='new'>NEW:</span> Progress bars for batch operations</li>
+        <li><span class='improve'>IMPROVE:</span> Unified status area across all tabs</li>
+        <li><span class='improve'>IMPROVE:</span> Responsive layout and consistent spacing</li>
+    </ul>
+    
+    <h4>Version 3.4 (February 2025)</h4>
+    <ul>
+        <li><span class='improve'>IMPROVE:</span> Updated co-developer attribution</li>
+        <li><span class='improve'>IMPROVE:</span> General performance enhancements</li>
+        <li><span class='fix'>FIX:</span> Minor UI adjustments</li>
+    </ul>
+    
+    <h4>Version 3.3 (February 2024)</h4>
+    <ul>
+        <li><span class='new'>NEW:</span> Dark mode toggle with Ctrl+T shortcut</li>
+        <li><span class='new'>NEW:</span> Enhanced status bar with reader and tag status</li>
+        <li><span class='new'>NEW:</span> Tab switching shortcuts (Ctrl+1/2/3)</li>
+        <li><span class='improve'>IMPROVE:</span> Better keyboard shortcuts and tooltips</li>
+        <li><span class='improve'>IMPROVE:</span> Enhanced URL validation and formatting</li>
+        <li><span class='fix'>FIX:</span> Clipboard paste functionality</li>
+    </ul>
+    
+    <h4>Version 3.2 (January 2024)</h4>
+    <ul>
+        <li><span class='new'>NEW:</span> Quick write button for single tags</li>
+        <li><span class='new'>NEW:</span> Recent URLs dropdown</li>
+        <li><span class='improve'>IMPROVE:</span> Enhanced tag detection reliability</li>
+        <li><span class='improve'>IMPROVE:</span> Better visual feedback for write operations</li>
+        <li><span class='fix'>FIX:</span> URL handling for local network addresses</li>
+    </ul>
+"""
+
 class AboutTab(QWidget):
     """About Tab UI component."""
     
@@ -35,7 +87,7 @@ class AboutTab(QWidget):
         # Version info
         version_label = QLabel("Version 3.5")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("font-weight: bold; color: #1976d2; margin: 10px 0;")
+        version_label.setObjectName("version_label")
         header_layout.addWidget(version_label)
         
         # Description
@@ -45,7 +97,7 @@ class AboutTab(QWidget):
         )
         desc_label.setWordWrap(True)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc_label.setStyleSheet("margin: 10px 0;")
+        desc_label.setObjectName("desc_label")
         header_layout.addWidget(desc_label)
         
         layout.addWidget(header_group)
@@ -80,139 +132,44 @@ class AboutTab(QWidget):
         manual_group.setContentsMargins(15, 15, 15, 15)  # Consistent padding
         manual_layout = QVBoxLayout(manual_group)
         
-        manual_text = QTextEdit()
-        manual_text.setReadOnly(True)
-        manual_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #fafafa;
-                border: none;
-                padding: 15px;
-            }
-        """)
-        manual_text.setHtml("""
-            <style>
-                h3 { color: #1976d2; margin-bottom: 15px; }
-                h4 { color: #2196f3; margin-top: 20px; margin-bottom: 10px; }
-                p { line-height: 1.6; margin-bottom: 15px; }
-                ol, ul { margin-left: 20px; line-height: 1.6; }
-                li { margin-bottom: 8px; }
-                .tip { 
-                    background-color: #e3f2fd; 
-                    padding: 10px 15px; 
-                    border-radius: 4px;
-                    margin: 10px 0;
-                }
-                .feature {
-                    color: #1976d2;
-                    font-weight: bold;
-                }
-            </style>
-            
-            <h3>Quick Start Guide</h3>
-            <p>Welcome to the NFC Reader/Writer application! This tool helps you interact with NFC tags using the ACR1252U reader.</p>
-            
-            <h4>Reading Tags</h4>
-            <ol>
-                <li><span class='feature'>Connect</span> your ACR1252U reader to your computer</li>
-                <li>Navigate to the <span class='feature'>"Read Tags"</span> tab</li>
-                <li>Click the <span class='feature'>"Start Scanning"</span> button</li>
-                <li>Present an NFC tag to the reader</li>
-                <li>The detected URL or text will be displayed automatically</li>
-            </ol>
-            
-            <h4>Writing Tags</h4>
-            <ol>
-                <li>Go to the <span class='feature'>"Write Tags"</span> tab</li>
-                <li>Enter the URL or text you want to write</li>
-                <li>Set the number of tags for batch writing (optional)</li>
-                <li>Choose whether to lock tags after writing</li>
-                <li>Click <span class='feature'>"Write to Tag"</span> and follow the prompts</li>
-            </ol>
-            
-            <h4>Copying Tags</h4>
-            <ol>
-                <li>Navigate to the <span class='feature'>"Copy Tags"</span> tab</li>
-                <li>Click <span class='feature'>"Read & Store Tag"</span> with your source tag</li>
-                <li>Present a new tag and click <span class='feature'>"Copy to New Tag"</span></li>
-                <li>Repeat for additional copies (up to 10 copies allowed)</li>
-            </ol>
-            
-            <h4>Status Indicators</h4>
-            <div class='tip'>
-                <p>The colored indicator shows the current tag status:</p>
-                <ul>
-                    <li>🟧 <span class='feature'>Orange</span> = No tag present</li>
-                    <li>🟩 <span class='feature'>Green</span> = Tag detected</li>
-                    <li>✅ <span class='feature'>Green with checkmark</span> = Tag locked</li>
-                </ul>
-            </div>
-        """)
-        manual_layout.addWidget(manual_text)
+        # Manual content is loaded from manual.html the first time the tab is shown
+        self.manual_text = QTextEdit()
+        self.manual_text.setReadOnly(True)
+        self.manual_text.setObjectName("manual_text")
+        self._content_loaded = False
+        manual_layout.addWidget(self.manual_text)
         
         # Changelog section
         changelog_group = QGroupBox("Changelog")
         changelog_group.setContentsMargins(15, 15, 15, 15)  # Consistent padding
         changelog_layout = QVBoxLayout(changelog_group)
         
-        changelog_text = QTextEdit()
-        changelog_text.setReadOnly(True)
-        changelog_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #fafafa;
-                border: none;
-                padding: 15px;
-            }
-        """)
-        changelog_text.setHtml("""
-            <style>
-                h4 { color: #1976d2; margin-top: 10px; margin-bottom: 5px; }
-                ul { margin-left: 20px; line-height: 1.4; }
-                li { margin-bottom: 6px; }
-                .new { color: #2e7d32; }
-                .fix { color: #d32f2f; }
-                .improve { color: #1976d2; }
-            </style>
-            
-            <h4>Version 3.5 (February 2025)</h4>
-            <ul>
-                <li><span class='new'>NEW:</span> NFC Tag Type Detection</li>
-                <li><span class='new'>NEW:</span> Visual feedback animations for tag detection</li>
-                <li><span class='new'>NEW:</span> Progress bars for batch operations</li>
-                <li><span class='improve'>IMPROVE:</span> Unified status area across all tabs</li>
-                <li><span class='improve'>IMPROVE:</span> Responsive layout and consistent spacing</li>
-            </ul>
-            
-            <h4>Version 3.4 (February 2025)</h4>
-            <ul>
-                <li><span class='improve'>IMPROVE:</span> Updated co-developer attribution</li>
-                <li><span class='improve'>IMPROVE:</span> General performance enhancements</li>
-                <li><span class='fix'>FIX:</span> Minor UI adjustments</li>
-            </ul>
-            
-            <h4>Version 3.3 (February 2024)</h4>
-            <ul>
-                <li><span class='new'>NEW:</span> Dark mode toggle with Ctrl+T shortcut</li>
-                <li><span class='new'>NEW:</span> Enhanced status bar with reader and tag status</li>
-                <li><span class='new'>NEW:</span> Tab switching shortcuts (Ctrl+1/2/3)</li>
-                <li><span class='improve'>IMPROVE:</span> Better keyboard shortcuts and tooltips</li>
-                <li><span class='improve'>IMPROVE:</span> Enhanced URL validation and formatting</li>
-                <li><span class='fix'>FIX:</span> Clipboard paste functionality</li>
-            </ul>
-            
-            <h4>Version 3.2 (January 2024)</h4>
-            <ul>
-                <li><span class='new'>NEW:</span> Quick write button for single tags</li>
-                <li><span class='new'>NEW:</span> Recent URLs dropdown</li>
-                <li><span class='improve'>IMPROVE:</span> Enhanced tag detection reliability</li>
-                <li><span class='improve'>IMPROVE:</span> Better visual feedback for write operations</li>
-                <li><span class='fix'>FIX:</span> URL handling for local network addresses</li>
-            </ul>
-        """)
-        changelog_layout.addWidget(changelog_text)
+        # Changelog content is also set the first time the tab is shown
+        self.changelog_text = QTextEdit()
+        self.changelog_text.setReadOnly(True)
+        self.changelog_text.setObjectName("changelog_text")
+        changelog_layout.addWidget(self.changelog_text)
         
         layout.addWidget(changelog_group)
         layout.addWidget(manual_group)
     
+    def load_content(self) -> bool:
+        """
+        Load the changelog and user manual HTML on first use.
+        
+        Returns:
+            bool: True if this call loaded the content, False if it was already loaded
+        """
+        if self._content_loaded:
+            return False
+        self._content_loaded = True
+        self.changelog_text.setHtml(CHANGELOG_HTML)
+        try:
+            self.manual_text.setHtml(MANUAL_PATH.read_text(encoding="utf-8"))
+        except OSError:
+            self.manual_text.setPlainText("User manual not available.")
+        return True
+    
     def set_icon(self, pixmap):
         """Set the app icon."""
         if pixmap and not pixmap.isNull():
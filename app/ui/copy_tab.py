@@ -6,7 +6,10 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QSpinBox, QCheckBox, QGroupBox,
                             QSizePolicy, QGridLayout, QProgressBar)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+
+# Tag indicator styles for a detected tag and while waiting for one
+TAG_DETECTED_STYLE = "background-color: #4CAF50; border-radius: 7px;"  # Green
+NO_TAG_STYLE = "background-color: #FF9800; border-radius: 7px;"  # Orange for no tag
 
 class CopyTab(QWidget):
     """Copy Tab UI component."""
@@ -20,6 +23,10 @@ class CopyTab(QWidget):
     def __init__(self, parent=None):
         """Initialize the Copy Tab UI."""
         super().__init__(parent)
+        
+        # (detected, locked) last shown by the tag indicator
+        self._tag_state = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -44,17 +51,7 @@ class CopyTab(QWidget):
         # Source tag info with improved display for long URLs
         source_layout.addWidget(QLabel("Source Tag Content:"))
         self.source_tag_info = QLabel("No source tag scanned yet")
-        self.source_tag_info.setStyleSheet("""
-            QLabel {
-                font-family: 'Segoe UI';
-                font-size: 11px;
-                color: #1976D2;
-                padding: 4px;
-                background-color: #E3F2FD;
-                border-radius: 3px; 
-                min-height: 30px;
-            }
-        """)
+        self.source_tag_info.setObjectName("source_tag_info")
         self.source_tag_info.setWordWrap(True)
         source_layout.addWidget(self.source_tag_info)
         
@@ -103,8 +100,7 @@ class CopyTab(QWidget):
         copy_op_layout.setSpacing(5)  # Reduced spacing
         
         # Progress section with label and progress bar
-        progress_widget = QWidget()
-        progress_layout = QVBoxLayout(progress_widget)
+        progress_layout = QVBoxLayout()
         progress_layout.setContentsMargins(0, 0, 0, 0)
         progress_layout.setSpacing(3)  # Tighter spacing between label and bar
         
@@ -134,30 +130,14 @@ class CopyTab(QWidget):
         self.reset_copy_button.clicked.connect(self._on_reset_clicked)
         self.reset_copy_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.reset_copy_button.setMinimumWidth(60)
-        self.reset_copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        self.reset_copy_button.setObjectName("reset_button")
         
         # Stop button
         self.stop_copy_button = QPushButton("Stop")
         self.stop_copy_button.clicked.connect(self._on_stop_clicked)
         self.stop_copy_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.stop_copy_button.setMinimumWidth(60)
-        self.stop_copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #D32F2F;
-            }
-        """)
+        self.stop_copy_button.setObjectName("stop_button")
         self.stop_copy_button.setEnabled(False)  # Disabled until copy operation starts
         
         # Add buttons to grid layout - will automatically wrap to new row when space is limited
@@ -187,7 +167,7 @@ class CopyTab(QWidget):
         tag_status_grid.addWidget(self.copy_tag_indicator, 0, 0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         tag_status_grid.addWidget(self.copy_tag_status_label, 0, 1, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         
-        copy_op_layout.addWidget(progress_widget)
+        copy_op_layout.addLayout(progress_layout)
         copy_op_layout.addLayout(tag_status_grid)
         
         layout.addWidget(copy_op_group)
@@ -232,15 +212,16 @@ class CopyTab(QWidget):
     
     def update_tag_status(self, detected, locked=False):
         """Update the tag status indicator."""
+        # Restyling the indicator repolishes it, so skip updates that change nothing
+        if (detected, locked) == self._tag_state:
+            return
+        self._tag_state = (detected, locked)
+        
         if detected:
-            if locked:
-                self.copy_tag_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 7px;")  # Green
-                self.copy_tag_status_label.setText("Tag Detected & Locked ")
-            else:
-                self.copy_tag_indicator.setStyleSheet("background-color: #4CAF50; border-radius: 7px;")  # Green
-                self.copy_tag_status_label.setText("Tag Detected")
+            self.copy_tag_indicator.setStyleSheet(TAG_DETECTED_STYLE)
+            self.copy_tag_status_label.setText("Tag Detected & Locked " if locked else "Tag Detected")
         else:
-            self.copy_tag_indicator.setStyleSheet("background-color: #FF9800; border-radius: 7px;")  # Orange for no tag
+            self.copy_tag_indicator.setStyleSheet(NO_TAG_STYLE)
             self.copy_tag_status_label.setText("Waiting for Tag...")
     
     def enable_copy_button(self, enabled):
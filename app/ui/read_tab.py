@@ -3,10 +3,19 @@ Read Tab UI components for the NFC Reader/Writer application.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QPushButton, QTextEdit, QCheckBox, QGroupBox,
+                            QPushButton, QPlainTextEdit, QCheckBox, QGroupBox,
                             QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+
+# Maximum number of lines kept in the log; older lines are discarded
+LOG_MAX_LINES = 2000
+
+# Log lines are buffered and appended together at most this often (milliseconds)
+LOG_FLUSH_INTERVAL = 100
+
+# HTML for a single log line
+LOG_LINE_TEMPLATE = ('<div style="font-family: Segoe UI"><span style="color: #666666">[{timestamp}]</span> '
+                     '<span style="color: {color}">[{title}]</span> {message}</div>')
 
 class ReadTab(QWidget):
     """Read Tab UI component."""
@@ -21,6 +30,14 @@ class ReadTab(QWidget):
     def __init__(self, parent=None):
         """Initialize the Read Tab UI."""
         super().__init__(parent)
+        
+        # Pending log lines, flushed to the log view in one batch
+        self._pending_log_html = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._log_flush_timer.timeout.connect(self.flush_log)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -52,18 +69,7 @@ class ReadTab(QWidget):
         url_group.setContentsMargins(5, 5, 5, 5)  # Reduced padding
         url_layout = QHBoxLayout(url_group)
         self.url_label = QLabel("")
-        self.url_label.setStyleSheet("""
-            QLabel {
-                font-family: 'Segoe UI';
-                font-size: 11px;
-                color: #1976D2;
-                padding: 4px;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                background-color: #f5f5f5;
-                min-height: 25px;
-            }
-        """)
+        self.url_label.setObjectName("url_label")
         self.url_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.url_label.setWordWrap(True)
         self.url_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -87,20 +93,11 @@ class ReadTab(QWidget):
         log_layout = QVBoxLayout(log_group)
         log_layout.setContentsMargins(5, 5, 5, 5)  # Reduced padding
         
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log text area (bounded so long scanning sessions don't grow it forever)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                line-height: 1.3;
-                background-color: #f8f8f8;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 4px;
-            }
-        """)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_text.setObjectName("log_text")
         self.log_text.setMinimumHeight(100)  # Reduced minimum height for log area
         log_layout.addWidget(self.log_text)
         
@@ -168,17 +165,36 @@ class ReadTab(QWidget):
     
     def append_log(self, title, message, timestamp, title_color):
         """Append formatted message to log."""
-        formatted_msg = f'<div style="font-family: Segoe UI"><span style="color: #666666">[{timestamp}]</span> <span style="color: {title_color}">[{title}]</span> {message}</div>'
-        
-        self.log_text.append(formatted_msg)
+        self._pending_log_html.append(LOG_LINE_TEMPLATE.format(
+            timestamp=timestamp, color=title_color, title=title, message=message))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def flush_log(self):
+        """Append all pending log lines and scroll to the bottom once."""
+        self._log_flush_timer.stop()
+        if not self._pending_log_html:
+            return
+        # Lines beyond the block limit would be dropped straight away
+        pending, self._pending_log_html = self._pending_log_html[-LOG_MAX_LINES:], []
+        
+        # One edit block, so the document is laid out once for the whole batch
+        cursor = self.log_text.textCursor()
+        cursor.beginEditBlock()
+        for formatted_msg in pending:
+            self.log_text.appendHtml(formatted_msg)
+        cursor.endEditBlock()
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()
         )
     
     def clear_log(self):
         """Clear the log text."""
+        self._log_flush_timer.stop()
+        self._pending_log_html = []
         self.log_text.clear()
     
     def get_log_text(self):
         """Get the log text content."""
+        self.flush_log()
         return self.log_text.toPlainText()
\ No newline at end of file
@@ -2,11 +2,14 @@
 Write Tab UI components for the NFC Reader/Writer application.
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
                             QPushButton, QLineEdit, QSpinBox, QCheckBox, 
                             QGroupBox, QSizePolicy, QComboBox, QProgressBar)
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont
+
+# Tag indicator styles for a detected tag and for an empty reader
+TAG_DETECTED_STYLE = "background-color: green; border-radius: 10px;"
+NO_TAG_STYLE = "background-color: red; border-radius: 10px;"
 
 class WriteTab(QWidget):
     """Write Tab UI component."""
@@ -22,6 +25,17 @@ class WriteTab(QWidget):
     def __init__(self, parent=None):
         """Initialize the Write Tab UI."""
         super().__init__(parent)
+        
+        # Latest validation result, shown again once the update confirmation expires
+        self._validation_text = ""
+        self._validation_style = "margin-top: 3px;"
+        self._confirmation_timer = QTimer(self)
+        self._confirmation_timer.setSingleShot(True)
+        self._confirmation_timer.timeout.connect(self.restore_validation_state)
+        
+        # (detected, locked) last shown by the tag indicator
+        self._tag_state = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -37,8 +51,7 @@ class WriteTab(QWidget):
         
         # URL input with tooltip
         input_label = QLabel("Enter URL to write to tag:")
-        input_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        input_label.setStyleSheet("color: #1976d2; margin-bottom: 5px;")
+        input_label.setObjectName("input_label")
         input_label.setToolTip("Enter a complete URL starting with http://, https://, or www.")
         
         # Add validation label
@@ -49,11 +62,10 @@ class WriteTab(QWidget):
         self.char_count_label = QLabel("Characters remaining: 137")
         self.char_count_label.setStyleSheet("color: #666666; margin-top: 3px;")
         
-        # Input container with buttons
-        input_container = QWidget()
-        input_container_layout = QHBoxLayout(input_container)
-        input_container_layout.setContentsMargins(0, 0, 0, 0)
-        input_container_layout.setSpacing(5)  # Reduced spacing between elements
+        # Input row with buttons
+        input_row = QGridLayout()
+        input_row.setContentsMargins(0, 0, 0, 0)
+        input_row.setSpacing(5)  # Reduced spacing between elements
         
         # Recent URLs dropdown
         self.url_combo = QComboBox()
@@ -64,25 +76,7 @@ class WriteTab(QWidget):
         self.url_combo.setInsertPolicy(QComboBox.InsertPolicy.InsertAtTop)
         self.url_combo.currentTextChanged.connect(self._on_text_changed)
         self.write_entry = self.url_combo.lineEdit()
-        self.write_entry.setStyleSheet("""
-            QLineEdit {
-                font-family: 'Segoe UI';
-                font-size: 12px;
-                padding: 4px;
-                border: 1px solid #e0e0e0;
-                border-radius: 3px;
-                margin-bottom: 3px;
-                margin-top: 2px;
-                min-width: 200px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #1976d2;
-                background-color: #f5f5f5;
-            }
-            QLineEdit::placeholder {
-                color: #9e9e9e;
-            }
-        """)
+        self.write_entry.setObjectName("url_entry")
         
         # Paste button with circular icon style
         paste_tooltip = "Paste URL from clipboard (Ctrl+V)"
@@ -90,19 +84,7 @@ class WriteTab(QWidget):
         paste_button.setToolTip(paste_tooltip)
         paste_button.clicked.connect(self._on_paste_clicked)
         paste_button.setFixedSize(28, 28)  # Reduced button size
-        paste_button.setStyleSheet("""
-            QPushButton { 
-                color: #1976d2;
-                background-color: white;
-                border: 1px solid #1976d2;
-                border-radius: 16px;
-                font-size: 16px;
-                padding: 0;
-            }
-            QPushButton:hover {
-                background-color: #e3f2fd;
-            }
-        """)
+        paste_button.setObjectName("icon_button_blue")
         
         # Clear button with circular icon style
         clear_tooltip = "Clear input field (Ctrl+L)"
@@ -110,26 +92,15 @@ class WriteTab(QWidget):
         clear_button.setToolTip(clear_tooltip)
         clear_button.clicked.connect(self._on_clear_clicked)
         clear_button.setFixedSize(28, 28)  # Reduced button size
-        clear_button.setStyleSheet("""
-            QPushButton { 
-                color: #f44336;
-                background-color: white;
-                border: 1px solid #f44336;
-                border-radius: 16px;
-                font-size: 16px;
-                padding: 0;
-            }
-            QPushButton:hover {
-                background-color: #ffebee;
-            }
-        """)
-        
-        input_container_layout.addWidget(self.write_entry)
-        input_container_layout.addWidget(paste_button, alignment=Qt.AlignmentFlag.AlignRight)
-        input_container_layout.addWidget(clear_button)
+        clear_button.setObjectName("icon_button_red")
+        
+        input_row.addWidget(self.write_entry, 0, 0)
+        input_row.addWidget(paste_button, 0, 1, Qt.AlignmentFlag.AlignRight)
+        input_row.addWidget(clear_button, 0, 2)
+        input_row.setColumnStretch(0, 1)
         
         input_layout.addWidget(input_label)
-        input_layout.addWidget(input_container)
+        input_layout.addLayout(input_row)
         input_layout.addWidget(self.validation_label)
         input_layout.addWidget(self.char_count_label)
         
@@ -139,12 +110,11 @@ class WriteTab(QWidget):
         test_url_button.clicked.connect(self._on_test_url_clicked)
         test_url_button.setMinimumWidth(80)
         test_url_button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-        input_container_layout.addWidget(test_url_button)
+        input_row.addWidget(test_url_button, 0, 3)
         
         # Batch writing section
-        batch_widget = QWidget()
-        batch_layout = QHBoxLayout(batch_widget)
-        batch_layout.setContentsMargins(0, 10, 0, 0)  # Add top padding for separation
+        batch_layout = QHBoxLayout()
+        batch_layout.setContentsMargins(0, 0, 0, 0)
         
         quantity_label = QLabel("Number of tags to write:")
         self.quantity_spinbox = QSpinBox() 
@@ -155,7 +125,8 @@ class WriteTab(QWidget):
         batch_layout.addWidget(self.quantity_spinbox)
         batch_layout.addStretch()
         
-        input_layout.addWidget(batch_widget)
+        input_layout.addSpacing(10)  # Add top padding for separation
+        input_layout.addLayout(batch_layout)
         layout.addWidget(input_group)
         
         # Options section
@@ -179,28 +150,13 @@ class WriteTab(QWidget):
         
         # Combined Progress & Status section with enhanced visibility
         status_group = QGroupBox("Status & Progress")
-        status_group.setStyleSheet("""
-            QGroupBox {
-                background: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                margin-top: 1.5em;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 3px;
-                color: #1976d2;
-            }
-        """)
+        status_group.setObjectName("status_group")
         status_layout = QVBoxLayout(status_group)  # Changed to vertical layout
         status_layout.setContentsMargins(5, 10, 5, 5)
         status_layout.setSpacing(5)  # Reduced spacing
 
         # Progress section with label and progress bar
-        progress_widget = QWidget()
-        progress_layout = QVBoxLayout(progress_widget)
+        progress_layout = QVBoxLayout()
         progress_layout.setContentsMargins(0, 0, 0, 0)
         progress_layout.setSpacing(3)  # Tighter spacing between label and bar
         
@@ -214,11 +170,10 @@ class WriteTab(QWidget):
         self.progress_bar.setTextVisible(True)
         progress_layout.addWidget(self.progress_bar)
         
-        status_layout.addWidget(progress_widget)
+        status_layout.addLayout(progress_layout)
         
         # Tag detection status
-        tag_status_widget = QWidget()
-        tag_status_layout = QHBoxLayout(tag_status_widget)
+        tag_status_layout = QHBoxLayout()
         tag_status_layout.setContentsMargins(0, 0, 0, 0)
         
         self.tag_indicator = QLabel()
@@ -230,11 +185,10 @@ class WriteTab(QWidget):
         tag_status_layout.addWidget(self.tag_status_label)
         tag_status_layout.addStretch()
         
-        status_layout.addWidget(tag_status_widget)
+        status_layout.addLayout(tag_status_layout)
         
         # Write status
-        write_status_widget = QWidget()
-        write_status_layout = QHBoxLayout(write_status_widget)
+        write_status_layout = QHBoxLayout()
         write_status_layout.setContentsMargins(0, 0, 0, 0)
         
         self.write_status = QLabel("")
@@ -246,7 +200,7 @@ class WriteTab(QWidget):
         self.clear_status_button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         write_status_layout.addWidget(self.clear_status_button)
         
-        status_layout.addWidget(write_status_widget)
+        status_layout.addLayout(write_status_layout)
         layout.addWidget(status_group)
         layout.addStretch()
     
@@ -280,31 +234,34 @@ class WriteTab(QWidget):
     
     def show_url_update_confirmation(self):
         """Show a temporary confirmation that URL has been updated."""
-        # Save current validation label state
-        current_text = self.validation_label.text()
-        current_style = self.validation_label.styleSheet()
-        
-        # Show confirmation
         self.validation_label.setStyleSheet("color: #4CAF50; margin-top: 3px; font-weight: bold;")
         self.validation_label.setText("✓ URL updated")
         
-        # Create a timer to restore the original validation state
-        QTimer.singleShot(1500, lambda: self.restore_validation_state(current_text, current_style))
+        # Restore the latest validation state once the confirmation expires
+        self._confirmation_timer.start(1500)
     
-    def restore_validation_state(self, text, style):
-        """Restore the validation label to its previous state."""
-        self.validation_label.setText(text)
-        self.validation_label.setStyleSheet(style)
+    def restore_validation_state(self):
+        """Restore the validation label to the latest validation state."""
+        try:
+            self.validation_label.setText(self._validation_text)
+            self.validation_label.setStyleSheet(self._validation_style)
+        except RuntimeError:
+            # Ignore errors if the UI element has been deleted
+            pass
     
     def update_validation(self, is_valid, message):
         """Update the validation label."""
         try:
             if is_valid:
-                self.validation_label.setStyleSheet("color: green; margin-top: 5px;")
-                self.validation_label.setText("✓ " + message)
+                self._validation_style = "color: green; margin-top: 5px;"
+                self._validation_text = "✓ " + message
             else:
-                self.validation_label.setStyleSheet("color: red; margin-top: 5px;")
-                self.validation_label.setText("✗ " + message)
+                self._validation_style = "color: red; margin-top: 5px;"
+                self._validation_text = "✗ " + message
+            
+            # Validation is debounced, so don't overwrite a confirmation still on screen
+            if not self._confirmation_timer.isActive():
+                self.restore_validation_state()
         except RuntimeError:
             # Ignore errors if the UI element has been deleted
             pass
@@ -332,12 +289,17 @@ class WriteTab(QWidget):
     
     def update_tag_status(self, detected, locked=False):
         """Update the tag status indicator."""
+        # Restyling the indicator repolishes it, so skip updates that change nothing
+        if (detected, locked) == self._tag_state:
+            return
+        self._tag_state = (detected, locked)
+        
         try:
             if detected:
-                self.tag_indicator.setStyleSheet("background-color: green; border-radius: 10px;")
+                self.tag_indicator.setStyleSheet(TAG_DETECTED_STYLE)
                 self.tag_status_label.setText("Tag Detected" + (" (Locked)" if locked else ""))
             else:
-                self.tag_indicator.setStyleSheet("background-color: red; border-radius: 10px;")
+                self.tag_indicator.setStyleSheet(NO_TAG_STYLE)
                 self.tag_status_label.setText("No Tag Detected")
         except RuntimeError:
             # Ignore errors if the UI element has been deleted
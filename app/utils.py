@@ -4,62 +4,96 @@ Utility functions and constants for the NFC Reader/Writer application.
 
 import re
 import string
-import subprocess
+import struct
 import time
 import urllib.request
 import urllib.error
 import ssl
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
+
+from PyQt6.QtCore import QUrl
+from PyQt6.QtGui import QDesktopServices
 
 # APDU Commands
 # Standard PC/SC commands that work with most readers
 GET_UID = [0xFF, 0xCA, 0x00, 0x00, 0x00]
 READ_PAGE = [0xFF, 0xB0, 0x00]  # Will append page number and length
+WRITE_PAGE = [0xFF, 0xD6, 0x00]  # Will append page number, length and data
+INIT_NDEF_CC = [0xFF, 0xD6, 0x00, 0x03, 0x04, 0xE1, 0x10, 0x06, 0x0F]  # Capability container for NDEF
 LOCK_CARD = [0xFF, 0xD6, 0x00, 0x02, 0x04, 0x00, 0x00, 0x00, 0x00]
+MAX_READ_LENGTH = 0x10  # NTAG/Ultralight READ returns 4 pages (16 bytes) per command
+# NTAG FAST_READ (0x3A) wrapped in a PN53x InCommunicateThru direct transmit; append start and end page
+FAST_READ = [0xFF, 0x00, 0x00, 0x00, 0x05, 0xD4, 0x42, 0x3A]
+FAST_READ_MAX_PAGES = 36  # Whole NTAG213 user memory (pages 4-39) in one command
 
 # Alternative commands for specific readers
 # Some ACR122U readers might need these alternative commands
 ALT_GET_UID = [0xFF, 0xCA, 0x00, 0x00, 0x04]  # With explicit length
 ALT_READ_PAGE = [0xFF, 0xB0, 0x00]  # Same as READ_PAGE but might be used differently
 
-# URL prefixes according to NFC Forum URI Record Type Definition
-URL_PREFIXES = {
-    0x00: "http://www.",
-    0x01: "https://www.",
-    0x02: "http://",
-    0x03: "https://",
-    0x04: "tel:",
-    0x05: "mailto:",
-    0x06: "ftp://anonymous:anonymous@",
-    0x07: "ftp://ftp.",
-    0x08: "ftps://",
-    0x09: "sftp://",
-    0x0A: "smb://",
-    0x0B: "nfs://",
-    0x0C: "ftp://",
-    0x0D: "dav://",
-    0x0E: "news:",
-    0x0F: "telnet://",
-    0x10: "imap:",
-    0x11: "rtsp://",
-    0x12: "urn:",
-    0x13: "pop:",
-    0x14: "sip:",
-    0x15: "sips:",
-    0x16: "tftp:",
-    0x17: "btspp://",
-    0x18: "btl2cap://",
-    0x19: "btgoep://",
-    0x1A: "tcpobex://",
-    0x1B: "irdaobex://",
-    0x1C: "file://",
-    0x1D: "urn:epc:id:",
-    0x1E: "urn:epc:tag:",
-    0x1F: "urn:epc:pat:",
-    0x20: "urn:epc:raw:",
-    0x21: "urn:epc:",
-    0x22: "urn:nfc:",
-}
+# URL prefixes according to NFC Forum URI Record Type Definition, indexed by prefix byte
+URL_PREFIXES = (
+    "http://www.",  # 0x00
+    "https://www.",  # 0x01
+    "http://",  # 0x02
+    "https://",  # 0x03
+    "tel:",  # 0x04
+    "mailto:",  # 0x05
+    "ftp://anonymous:anonymous@",  # 0x06
+    "ftp://ftp.",  # 0x07
+    "ftps://",  # 0x08
+    "sftp://",  # 0x09
+    "smb://",  # 0x0A
+    "nfs://",  # 0x0B
+    "ftp://",  # 0x0C
+    "dav://",  # 0x0D
+    "news:",  # 0x0E
+    "telnet://",  # 0x0F
+    "imap:",  # 0x10
+    "rtsp://",  # 0x11
+    "urn:",  # 0x12
+    "pop:",  # 0x13
+    "sip:",  # 0x14
+    "sips:",  # 0x15
+    "tftp:",  # 0x16
+    "btspp://",  # 0x17
+    "btl2cap://",  # 0x18
+    "btgoep://",  # 0x19
+    "tcpobex://",  # 0x1A
+    "irdaobex://",  # 0x1B
+    "file://",  # 0x1C
+    "urn:epc:id:",  # 0x1D
+    "urn:epc:tag:",  # 0x1E
+    "urn:epc:pat:",  # 0x1F
+    "urn:epc:raw:",  # 0x20
+    "urn:epc:",  # 0x21
+    "urn:nfc:",  # 0x22
+)
+
+# URL_PREFIXES padded to every possible prefix byte so lookups need no bounds check
+_URL_PREFIX_TABLE = URL_PREFIXES + ("",) * (256 - len(URL_PREFIXES))
+
+# Short NDEF URI record header followed by the URI prefix byte
+_URI_RECORD_HEADER = struct.Struct("5B")
+
+# Web URLs that lost their leading 'h' (e.g. 'ttps://'); fixed by prepending it
+_MISSING_H_PREFIXES = ('ttps://', 'tps://', 'tp://', 'ttp://')
+
+# Bare domain such as "example.com" or "www.example.com" (optionally followed by a path)
+DOMAIN_RE = re.compile(r'^[a-zA-Z0-9-]+\.(?:[a-zA-Z0-9-]+\.)?[a-zA-Z]{2,}')
+
+# https:// URL pointing at a private LAN address (10/8, 172.16/12, 192.168/16)
+_LAN_HTTPS_RE = re.compile(r'^https://(?:10\.|172\.(?:1[6-9]|2[0-9]|3[01])\.|192\.168\.)')
+
+# Lenient check for a complete http(s) URL
+_VALID_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+# Matches any character outside string.printable, for stripping decoded tag content
+_NON_PRINTABLE_RE = re.compile(f"[^{re.escape(string.printable)}]")
+
+# PC/SC errors raised whenever a tag is lifted off the reader, which are not worth reporting
+_DISCONNECT_ERRORS_RE = re.compile("card is not connected|no smart card inserted|card is unpowered",
+                                   re.IGNORECASE)
 
 def get_reader_specific_commands(reader_str: str) -> dict:
     """
@@ -71,24 +105,32 @@ def get_reader_specific_commands(reader_str: str) -> dict:
     Returns:
         dict: Dictionary of commands for the specific reader
     """
-    commands = {
+    # ACR122U might need alternative commands in some cases. For now the standard
+    # commands work on every supported reader, but ALT_GET_UID/ALT_READ_PAGE are
+    # available if needed
+    return {
         'GET_UID': GET_UID,
         'READ_PAGE': READ_PAGE,
         'LOCK_CARD': LOCK_CARD
     }
+
+def is_disconnect_error(error_msg: str) -> bool:
+    """
+    Check whether a card error just means the tag was removed.
     
-    # ACR122U might need alternative commands in some cases
-    if "ACR122" in reader_str:
-        # For now, we're using the standard commands as they should work,
-        # but we have alternatives available if needed
-        # commands['GET_UID'] = ALT_GET_UID
-        pass
+    Args:
+        error_msg: Text of the exception raised by the card operation
         
-    return commands
+    Returns:
+        bool: True for the usual tag-removed errors, False otherwise
+    """
+    return _DISCONNECT_ERRORS_RE.search(error_msg) is not None
 
 def open_url_in_browser(url: str) -> bool:
     """
-    Attempt to open a URL in a browser.
+    Attempt to open a URL in the default browser.
+    
+    Uses QDesktopServices, so it must be called from the GUI thread.
     
     Args:
         url: The URL to open
@@ -98,41 +140,14 @@ def open_url_in_browser(url: str) -> bool:
     """
     # Add http:// prefix to URLs that don't have a protocol
     if not url.startswith(("http://", "https://")):
-        # Check if it's an IP address or domain
-        if re.match(r'^(\d{1,3}\.){3}\d{1,3}(:\d+)?', url) or '.' in url:
+        # Check if it's an IP address or domain (both contain a dot)
+        if '.' in url:
             url = "http://" + url
         else:
             return False  # Not a URL we can open
-        
+    
     try:
-        # On Linux, use google-chrome as the primary browser
-        try:
-            # Use Popen instead of run to avoid blocking and potential freezes
-            process = subprocess.Popen(
-                ['google-chrome', '--new-window', url], 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-                close_fds=True  # Ensure file descriptors are closed
-            )
-            # Don't wait for process to complete
-            return True
-        except (FileNotFoundError, subprocess.SubprocessError):
-            # Fallback to xdg-open if google-chrome is not available
-            try:
-                # Use Popen instead of run to avoid blocking and potential freezes
-                process = subprocess.Popen(
-                    ['xdg-open', url], 
-                    stdout=subprocess.DEVNULL, 
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True,
-                    close_fds=True  # Ensure file descriptors are closed
-                )
-                # Don't wait for process to complete
-                return True
-            except (FileNotFoundError, subprocess.SubprocessError) as e:
-                print(f"Failed to open URL with xdg-open: {str(e)}")
-                return False
+        return QDesktopServices.openUrl(QUrl(url))
     except Exception as e:
         print(f"Error opening URL: {str(e)}")
         return False
@@ -154,19 +169,16 @@ def validate_url(url: str) -> Tuple[bool, str]:
     normalized_url = url.strip()
     
     # Handle tel: prefix on web URLs
-    if normalized_url.startswith('tel:') and ('.' in normalized_url or '/' in normalized_url.replace('tel:', '')):
+    if normalized_url.startswith('tel:') and ('.' in normalized_url or '/' in normalized_url):
         # This is likely a web URL incorrectly tagged with tel: prefix
         web_url = normalized_url.replace('tel:', '').strip()
-        if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url) or \
-           re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url):
+        if DOMAIN_RE.match(web_url):
             normalized_url = 'https://' + web_url
         else:
             normalized_url = 'http://' + web_url
     
     # Fix common URL typos
-    if normalized_url.startswith(('ttps://', 'tps://', 'tp://')):
-        normalized_url = 'h' + normalized_url
-    elif normalized_url.startswith(('ttp://', 'tp://')):
+    if normalized_url.startswith(_MISSING_H_PREFIXES):
         normalized_url = 'h' + normalized_url
     elif normalized_url.startswith('htttps://'):
         normalized_url = 'https://' + normalized_url[8:]
@@ -176,27 +188,50 @@ def validate_url(url: str) -> Tuple[bool, str]:
         normalized_url = 'https://' + normalized_url
     elif not normalized_url.startswith(('http://', 'https://')):
         # Check if it looks like a domain
-        if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', normalized_url) or \
-           re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', normalized_url):
+        if DOMAIN_RE.match(normalized_url):
             normalized_url = 'https://' + normalized_url
     
     # Check if URL is a LAN IP and rewrite https:// to http://
-    lan_ip_pattern = re.compile(r'^https://(?:10\.|172\.(?:1[6-9]|2[0-9]|3[01])\.|192\.168\.)')
-    if lan_ip_pattern.match(normalized_url):
+    if _LAN_HTTPS_RE.match(normalized_url):
         normalized_url = 'http://' + normalized_url[8:]  # Replace https:// with http://
     
     # More lenient URL validation
-    is_valid = bool(re.match(r'^https?://[^\s/$.?#].[^\s]*$', normalized_url))
+    is_valid = bool(_VALID_URL_RE.match(normalized_url))
     
     return is_valid, normalized_url
 
-def extract_url_from_data(data: List[int], toHexString) -> Optional[str]:
+def _find_ndef_record(data: bytes, start: int, end: int, record_type: int) -> int:
     """
-    Extract URL from NDEF data if possible.
+    Find a short well-known NDEF record header (0xD1) of the given type.
     
     Args:
         data: Raw tag data
+        start: First index to search
+        end: Index at which to stop searching (exclusive, at most len(data) - 3)
+        record_type: Record type byte to match (e.g. 0x55 for URL, 0x54 for Text)
+        
+    Returns:
+        int: Index of the record header, or -1 if not found
+    """
+    if end <= start:
+        return -1
+    j = data.find(b'\xD1', start, end)
+    while j != -1:
+        if data[j+3] == record_type:
+            return j
+        j = data.find(b'\xD1', j + 1, end)
+    return -1
+
+def extract_url_from_data(data: Union[bytes, bytearray, List[int]], toHexString,
+                          tlv_offset: Optional[int] = None) -> Optional[str]:
+    """
+    Extract URL from NDEF data if possible.
+    
+    Args:
+        data: Raw tag data (bytes-like, or a list of byte values)
         toHexString: Function to convert bytes to hex string
+        tlv_offset: Where the first TLV should be (4 when data starts with the
+            capability container, 0 when it starts at page 4), tried first
         
     Returns:
         Optional[str]: Extracted URL or None
@@ -206,106 +241,102 @@ def extract_url_from_data(data: List[int], toHexString) -> Optional[str]:
         if len(data) < 8:  # Need minimum length for NDEF
             return None
             
-        # Look for NDEF TLV
-        for i in range(len(data) - 2):
-            if data[i] == 0x03:  # NDEF TLV
-                length = data[i+1]
-                if i + 2 + length > len(data):
-                    continue
+        # Work on bytes so TLV and record searches run as C-level scans
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        view = memoryview(data)
+        n = len(data)
+        
+        # Look for NDEF TLV, trying the position the caller expects it at first
+        first = tlv_offset if tlv_offset is not None and data[tlv_offset] == 0x03 else -1
+        i = first if first != -1 else data.find(b'\x03', 0, n - 2)
+        while i != -1:
+            length = data[i+1]
+            if i + 2 + length <= n:
+                # Record headers must start at least 4 bytes before the end of the TLV value
+                records_end = i + 2 + length - 4
+                
+                # Check for URL record (D1 with type U) with improved detection for long URLs
+                j = _find_ndef_record(data, i+2, records_end, 0x55)
+                if j != -1:
+                    # Record header: flags, type length, payload length, type, then the URL prefix byte
+                    _, _, payload_length, _, url_prefix_byte = _URI_RECORD_HEADER.unpack_from(data, j)
+                    prefix = _URL_PREFIX_TABLE[url_prefix_byte]
                     
-                # Check for URL record with improved detection for long URLs
-                for j in range(i+2, i+2+length-4):
-                    # Check for URL record (D1 with type U)
-                    if j+3 < len(data) and data[j] == 0xD1 and data[j+3] == 0x55:  # URL record
-                        # Get URL prefix from the first byte of payload
-                        url_prefix_byte = data[j+4]
-                        prefix = URL_PREFIXES.get(url_prefix_byte, "")
-                        
-                        # Calculate the correct end position for the URL content
-                        payload_length = data[j+2]
-                        url_start = j + 5  # Skip record header and prefix byte
-                        url_end = j + 5 + payload_length - 1  # -1 for the prefix byte
+                    # Calculate the correct end position for the URL content
+                    url_start = j + 5  # Skip record header and prefix byte
+                    url_end = j + 5 + payload_length - 1  # -1 for the prefix byte
+                    
+                    # Ensure we don't exceed array bounds
+                    if url_end > n:
+                        url_end = n
                         
-                        # Ensure we don't exceed array bounds
-                        if url_end > len(data):
-                            url_end = len(data)
-                            
-                        url_content = bytes(data[url_start:url_end]).decode('utf-8', errors='replace')
+                    url_content = str(view[url_start:url_end], 'utf-8', 'replace')
+                    
+                    # Fix for URLs starting with 10.0.0.1
+                    if url_content.startswith("0.0.0.1"):
+                        url_content = "10.0.0.1" + url_content[7:]
+                    
+                    # Clean up the URL by removing any non-printable or special characters
+                    cleaned_url = _NON_PRINTABLE_RE.sub("", url_content)
+                    
+                    # Get the complete URL
+                    complete_url = prefix + cleaned_url.strip()
+                    
+                    # Check if this is a tel: prefix but actually looks like a web URL
+                    if complete_url.startswith('tel:') and ('.' in cleaned_url or '/' in cleaned_url):
+                        # This is likely a web URL incorrectly tagged with tel: prefix
+                        # Strip the tel: prefix and check if it looks like a domain
+                        web_url = cleaned_url.strip()
+                        if DOMAIN_RE.match(web_url):
+                            complete_url = 'https://' + web_url
+                        else:
+                            complete_url = 'http://' + web_url
+                    
+                    # Fix common URL typos
+                    if complete_url.startswith(_MISSING_H_PREFIXES):
+                        complete_url = 'h' + complete_url
+                    elif complete_url.startswith('htttps://'):
+                        complete_url = 'https://' + complete_url[8:]
+                    
+                    # Add protocol if missing and looks like a domain
+                    if not complete_url.startswith(('http://', 'https://')):
+                        if DOMAIN_RE.match(complete_url):
+                            complete_url = 'https://' + complete_url
+                    
+                    return complete_url
+                # Check for Text record
+                j = _find_ndef_record(data, i+2, records_end, 0x54)
+                while j != -1:
+                    lang_code_length = data[j+5] & 0x3F
+                    text_start = j+6+lang_code_length
+                    text_end = j+2+data[j+2]
+                    if text_start < text_end:
+                        text_content = str(view[text_start:text_end], 'utf-8', 'replace').strip('\x00')
                         
                         # Fix for URLs starting with 10.0.0.1
-                        if url_content.startswith("0.0.0.1"):
-                            url_content = "10.0.0.1" + url_content[7:]
-                        
-                        # Clean up the URL by removing any non-printable or special characters
-                        cleaned_url = ""
-                        for char in url_content:
-                            if char in string.printable and char != '':
-                                cleaned_url += char
+                        if text_content.startswith("0.0.0.1"):
+                            text_content = "10.0.0.1" + text_content[7:]
                         
-                        # Get the complete URL
-                        complete_url = prefix + cleaned_url.strip()
-                        
-                        # Check if this is a tel: prefix but actually looks like a web URL
-                        if complete_url.startswith('tel:') and ('.' in cleaned_url or '/' in cleaned_url):
-                            # This is likely a web URL incorrectly tagged with tel: prefix
-                            # Strip the tel: prefix and check if it looks like a domain
-                            web_url = cleaned_url.strip()
-                            if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url) or \
-                               re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url):
-                                complete_url = 'https://' + web_url
-                            else:
-                                complete_url = 'http://' + web_url
+                        # Clean up the text by removing any non-printable or special characters
+                        cleaned_text = _NON_PRINTABLE_RE.sub("", text_content).strip()
                         
+                        # Check if the text looks like a URL
+                        if DOMAIN_RE.match(cleaned_text):
+                            return 'https://' + cleaned_text
+                            
                         # Fix common URL typos
-                        if complete_url.startswith(('ttps://', 'tps://', 'tp://')):
-                            complete_url = 'h' + complete_url
-                        elif complete_url.startswith(('ttp://', 'tp://')):
-                            complete_url = 'h' + complete_url
-                        elif complete_url.startswith('htttps://'):
-                            complete_url = 'https://' + complete_url[8:]
-                        
-                        # Add protocol if missing and looks like a domain
-                        if not complete_url.startswith(('http://', 'https://')):
-                            if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', complete_url) or \
-                               re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', complete_url):
-                                complete_url = 'https://' + complete_url
+                        if cleaned_text.startswith(_MISSING_H_PREFIXES):
+                            return 'h' + cleaned_text
+                        elif cleaned_text.startswith('htttps://'):
+                            return 'https://' + cleaned_text[8:]
                         
-                        return complete_url
-                # Check for Text record
-                for j in range(i+2, i+2+length-4):
-                    if data[j] == 0xD1 and data[j+3] == 0x54:  # Text record
-                        lang_code_length = data[j+5] & 0x3F
-                        text_start = j+6+lang_code_length
-                        text_end = j+2+data[j+2]
-                        if text_start < text_end:
-                            text_content = bytes(data[text_start:text_end]).decode('utf-8', errors='replace').strip('\x00')
-                            
-                            # Fix for URLs starting with 10.0.0.1
-                            if text_content.startswith("0.0.0.1"):
-                                text_content = "10.0.0.1" + text_content[7:]
-                            
-                            # Clean up the text by removing any non-printable or special characters
-                            cleaned_text = ""
-                            for char in text_content:
-                                if char in string.printable and char != '':
-                                    cleaned_text += char
-                            
-                            cleaned_text = cleaned_text.strip()
-                            
-                            # Check if the text looks like a URL
-                            if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', cleaned_text) or \
-                               re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', cleaned_text):
-                                return 'https://' + cleaned_text
-                                
-                            # Fix common URL typos
-                            if cleaned_text.startswith(('ttps://', 'tps://', 'tp://')):
-                                return 'h' + cleaned_text
-                            elif cleaned_text.startswith(('ttp://', 'tp://')):
-                                return 'h' + cleaned_text
-                            elif cleaned_text.startswith('htttps://'):
-                                return 'https://' + cleaned_text[8:]
-                            
-                            return cleaned_text
+                        return cleaned_text
+                    j = _find_ndef_record(data, j+1, records_end, 0x54)
+            # Nothing at the expected position: scan the whole dump as before
+            start = 0 if i == first else i + 1
+            first = -1
+            i = data.find(b'\x03', start, n - 2)
         return None
     except Exception:
         return None
\ No newline at end of file
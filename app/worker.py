@@ -0,0 +1,109 @@
+"""
+Card I/O worker for the NFC Reader/Writer application.
+"""
+
+import queue
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+
+class NFCWorker(QObject):
+    """Runs PC/SC card operations one at a time on a dedicated thread."""
+    
+    # Signals
+    job_submitted = pyqtSignal()
+    job_scheduled = pyqtSignal(int, object)
+    job_failed = pyqtSignal(str)
+    
+    def __init__(self, max_pending: int = 4, parent=None):
+        """
+        Initialize the worker and its thread.
+        
+        Args:
+            max_pending: Maximum number of submitted operations waiting to run
+            parent: Parent QObject (must be None for the worker itself to be moved)
+        """
+        super().__init__(parent)
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self.worker_thread = QThread()
+        self.worker_thread.setObjectName("NFCWorker")
+        self.moveToThread(self.worker_thread)
+        
+        # Emitted from the GUI thread, so Qt wakes the worker thread once per queued job
+        self.job_submitted.connect(self._run_next_job)
+        self.job_scheduled.connect(self._schedule_job)
+    
+    def start(self):
+        """Start the worker thread."""
+        self.worker_thread.start()
+    
+    def submit(self, func, *args, **kwargs) -> bool:
+        """
+        Queue a card operation to run on the worker thread.
+        
+        Operations run in submission order and never overlap, so reader
+        access is serialized without any explicit locking.
+        
+        Args:
+            func: Callable performing the card operation
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            bool: True if queued, False if too many operations are already waiting
+        """
+        try:
+            self._jobs.put_nowait((func, args, kwargs))
+        except queue.Full:
+            return False
+        self.job_submitted.emit()
+        return True
+    
+    def submit_later(self, delay_ms: int, func, *args, **kwargs):
+        """
+        Queue a card operation to run on the worker thread after a delay.
+        
+        The delay is a timer on the worker's event loop rather than a sleep,
+        so operations submitted in the meantime still run straight away.
+        
+        Args:
+            delay_ms: Delay before the operation runs, in milliseconds
+            func: Callable performing the card operation
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        self.job_scheduled.emit(delay_ms, (func, args, kwargs))
+    
+    @pyqtSlot(int, object)
+    def _schedule_job(self, delay_ms, job):
+        """Start a timer for a delayed operation (runs on the worker thread)."""
+        QTimer.singleShot(delay_ms, lambda: self._run_job(job))
+    
+    @pyqtSlot()
+    def _run_next_job(self):
+        """Run the oldest queued card operation."""
+        try:
+            job = self._jobs.get_nowait()
+        except queue.Empty:
+            return
+        self._run_job(job)
+    
+    def _run_job(self, job):
+        """Run a queued card operation."""
+        func, args, kwargs = job
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            self.job_failed.emit(f"{getattr(func, '__name__', 'Card operation')} failed: {str(e)}")
+    
+    def stop(self, timeout_ms: int = 1000) -> bool:
+        """
+        Stop the worker thread once the current operation has returned.
+        
+        Args:
+            timeout_ms: Maximum time to wait for the thread to finish
+        
+        Returns:
+            bool: True if the thread finished within the timeout
+        """
+        self.worker_thread.quit()
+        return self.worker_thread.wait(timeout_ms)
\ No newline at end of file
@@ -2,11 +2,27 @@
 NFC Writer functionality for the NFC Reader/Writer application.
 """
 
-import time
-from typing import List, Tuple, Callable, Any, Optional
 import re
+import time
+from typing import Tuple, Callable, Any, Optional
+
+from app.utils import (GET_UID, LOCK_CARD, WRITE_PAGE, INIT_NDEF_CC, DOMAIN_RE, get_reader_specific_commands,
+                       is_disconnect_error)
 
-from app.utils import GET_UID, LOCK_CARD, get_reader_specific_commands
+# Web URL prefixes and their URI prefix codes
+_WEB_URL_PREFIX_CODES = {
+    'http://www.': 0x00,
+    'https://www.': 0x01,
+    'http://': 0x02,
+    'https://': 0x03,
+}
+
+# Longest web URL prefix at the start of the text (the www. forms win)
+_WEB_URL_PREFIX_RE = re.compile(r'https?://(?:www\.)?')
+
+# Top-level domains that mark prefix-less text as a web URL, matched anywhere in the
+# lowercased text (so "shop.community" counts, as with the original substring check)
+_WEB_TLD_RE = re.compile(r'\.(?:com|org|net|edu|gov|io|app)')
 
 class NFCWriter:
     """Class to handle NFC writer operations."""
@@ -21,8 +37,12 @@ class NFCWriter:
         """
         self.toHexString = toHexString_func
         self.debug_callback = debug_callback
+        self.debug_enabled = False  # Debug-level messages are only built and sent when enabled
+        self.writing = False  # Cleared by stop_batch_write to end a running batch
+        self.last_write_time = 0.0  # When a tag's memory was last written to
     
-    def write_url_to_tag(self, connection, url: str, lock: bool = True) -> Tuple[bool, str]:
+    def write_url_to_tag(self, connection, url: str, lock: bool = True,
+                         ndef_data: Optional[bytes] = None) -> Tuple[bool, str]:
         """
         Write a URL to an NFC tag.
         Enhanced for better compatibility with different reader models.
@@ -31,6 +51,7 @@ class NFCWriter:
             connection: Active card connection
             url: URL to write
             lock: Whether to lock the tag after writing
+            ndef_data: NDEF message already built for url, to skip rebuilding it
             
         Returns:
             Tuple[bool, str]: (success, message)
@@ -56,22 +77,24 @@ class NFCWriter:
             if sw1 != 0x90:
                 return False, f"Tag presence check failed: SW1={sw1:02X} SW2={sw2:02X}"
             
-            uid = self.toHexString(response)
+            uid = bytes(response).hex(' ').upper()
             
             # Create NDEF message for URL
-            ndef_data = self._create_url_ndef(url)
+            if ndef_data is None:
+                ndef_data = self._create_url_ndef(url)
             
             # ACR122U sometimes needs a small delay before initialization
             if is_acr122u:
                 time.sleep(0.1)  # Increased from 0.05 for more reliability
             
-            # Initialize NDEF capability
-            init_command = [0xFF, 0xD6, 0x00, 0x03, 0x04, 0xE1, 0x10, 0x06, 0x0F]
+            # Tag memory changes from here on, even if a later step fails
+            self.last_write_time = time.monotonic()
             
+            # Initialize NDEF capability
             # Add retry logic for initialization
             for retry in range(max_retries):
                 try:
-                    response, sw1, sw2 = connection.transmit(init_command)
+                    response, sw1, sw2 = connection.transmit(INIT_NDEF_CC)
                     break
                 except Exception as e:
                     if retry == max_retries - 1:
@@ -87,15 +110,14 @@ class NFCWriter:
                 
             # Write data in chunks of 4 bytes (one page at a time)
             chunk_size = 4
-            for i in range(0, len(ndef_data), chunk_size):
-                chunk = ndef_data[i:i + chunk_size]
+            
+            # Pad the data to whole pages once, then fill one reusable command per page
+            padded_data = ndef_data + bytes(-len(ndef_data) % chunk_size)
+            write_command = WRITE_PAGE + [0, chunk_size] + [0] * chunk_size
+            for i in range(0, len(padded_data), chunk_size):
                 page = 4 + (i // chunk_size)  # Start from page 4
-                
-                # Pad the last chunk with zeros if needed
-                if len(chunk) < chunk_size:
-                    chunk = chunk + [0] * (chunk_size - len(chunk))
-                
-                write_command = [0xFF, 0xD6, 0x00, page, chunk_size] + chunk
+                write_command[3] = page
+                write_command[5:] = padded_data[i:i + chunk_size]
                 
                 # Add retry logic for writing
                 for retry in range(max_retries):
@@ -116,22 +138,35 @@ class NFCWriter:
             
             # Verify the write by reading back a few pages
             try:
-                # Read back the first few pages to verify
-                for page in range(4, min(8, 4 + (len(ndef_data) + 3) // 4)):
-                    read_cmd = commands['READ_PAGE'] + [page, 0x04]
-                    
-                    # Add retry logic for verification
-                    for retry in range(max_retries):
-                        try:
-                            response, sw1, sw2 = connection.transmit(read_cmd)
-                            break
-                        except Exception as e:
-                            if retry == max_retries - 1:
-                                return False, f"Verification failed: Could not read page {page} after {max_retries} attempts"
-                            time.sleep(0.1 * (retry + 1))
-                    
-                    if sw1 != 0x90:
-                        return False, f"Verification failed: Could not read page {page}"
+                verify_pages = min(4, (len(ndef_data) + 3) // 4)
+                
+                # Readers that accept a larger Le return all of them in one READ BINARY
+                verified = False
+                if verify_pages > 1:
+                    try:
+                        response, sw1, sw2 = connection.transmit(commands['READ_PAGE'] + [4, verify_pages * 4])
+                        verified = sw1 == 0x90 and len(response) == verify_pages * 4
+                    except Exception:
+                        pass
+                
+                if not verified:
+                    # Otherwise read back the first few pages one at a time
+                    read_cmd = commands['READ_PAGE'] + [0, 0x04]
+                    for page in range(4, 4 + verify_pages):
+                        read_cmd[3] = page
+                        
+                        # Add retry logic for verification
+                        for retry in range(max_retries):
+                            try:
+                                response, sw1, sw2 = connection.transmit(read_cmd)
+                                break
+                            except Exception as e:
+                                if retry == max_retries - 1:
+                                    return False, f"Verification failed: Could not read page {page} after {max_retries} attempts"
+                                time.sleep(0.1 * (retry + 1))
+                        
+                        if sw1 != 0x90:
+                            return False, f"Verification failed: Could not read page {page}"
             except Exception as e:
                 return False, f"Verification error: {str(e)}"
             
@@ -160,7 +195,7 @@ class NFCWriter:
         except Exception as e:
             return False, f"Write error: {str(e)}"
     
-    def _create_url_ndef(self, text: str) -> List[int]:
+    def _create_url_ndef(self, text: str) -> bytes:
         """
         Create NDEF message for a URL.
         
@@ -168,89 +203,65 @@ class NFCWriter:
             text: URL text
             
         Returns:
-            List[int]: NDEF message bytes
+            bytes: NDEF message bytes
         """
-        text_bytes = list(text.encode('utf-8'))
-        
-        # URL prefixes according to NFC Forum URI Record Type Definition
-        url_prefixes = {
-            'http://www.': 0x00,
-            'https://www.': 0x01,
-            'http://': 0x02,
-            'https://': 0x03,
-            'tel:': 0x04,
-            'mailto:': 0x05,
-        }
-        
-        # Determine record type and data
-        prefix_found = None
-        remaining_text = text
+        text_bytes = text.encode('utf-8')
         
         # Detect if the text looks like a web URL
-        looks_like_web = any(
-            "." + tld in text.lower() for tld in [
-                "com", "org", "net", "edu", "gov", "io", "app"
-            ]
-        )
+        looks_like_web = _WEB_TLD_RE.search(text.lower()) is not None
         
         # Determine record type and data
-        if text.startswith(('http://www.', 'https://www.', 'http://', 'https://')):
+        prefix_match = _WEB_URL_PREFIX_RE.match(text)
+        if prefix_match:
             # This is a web URL with explicit prefix
-            for prefix, code in url_prefixes.items():
-                if text.startswith(prefix):
-                    prefix_found = code
-                    remaining_text = text[len(prefix):]
-                    break
-            if prefix_found is not None:
-                # URL record with prefix
-                remaining_bytes = list(remaining_text.encode('utf-8'))
-                payload_length = len(remaining_bytes) + 1  # +1 for the prefix byte
-                ndef_header = [0xD1, 0x01, payload_length, 0x55]  # Type: U (URL)
-                record_data = [prefix_found] + remaining_bytes
-            else:
-                # Fallback to text if no prefix matched
-                payload_length = len(text_bytes) + 1  # +1 for language code length
-                ndef_header = [0xD1, 0x01, payload_length, 0x54, 0x00]  # Type: T (Text)
-                record_data = text_bytes
-        elif text.startswith('tel:') and ('.' in text or '/' in text.replace('tel:', '')):
+            prefix = prefix_match.group()
+            prefix_found = _WEB_URL_PREFIX_CODES[prefix]
+            remaining_bytes = text_bytes[len(prefix):]  # Prefixes are ASCII, one byte per character
+            payload_length = len(remaining_bytes) + 1  # +1 for the prefix byte
+            ndef_header = bytes((0xD1, 0x01, payload_length, 0x55))  # Type: U (URL)
+            record_data = bytes((prefix_found,)) + remaining_bytes
+        elif text.startswith('tel:') and ('.' in text or '/' in text):
             # This is likely a web URL incorrectly prefixed with tel:
             web_url = text.replace('tel:', '').strip()
-            if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url) or \
-               re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', web_url):
+            if DOMAIN_RE.match(web_url):
                 # Add https:// prefix and treat as URL
                 prefix_found = 0x03  # https://
-                remaining_bytes = list(web_url.encode('utf-8'))
+                remaining_bytes = web_url.encode('utf-8')
                 payload_length = len(remaining_bytes) + 1  # +1 for the prefix byte
-                ndef_header = [0xD1, 0x01, payload_length, 0x55]  # Type: U (URL)
-                record_data = [prefix_found] + remaining_bytes
+                ndef_header = bytes((0xD1, 0x01, payload_length, 0x55))  # Type: U (URL)
+                record_data = bytes((prefix_found,)) + remaining_bytes
             else:
                 # Add http:// prefix and treat as URL
                 prefix_found = 0x02  # http://
-                remaining_bytes = list(web_url.encode('utf-8'))
+                remaining_bytes = web_url.encode('utf-8')
                 payload_length = len(remaining_bytes) + 1  # +1 for the prefix byte
-                ndef_header = [0xD1, 0x01, payload_length, 0x55]  # Type: U (URL)
-                record_data = [prefix_found] + remaining_bytes
+                ndef_header = bytes((0xD1, 0x01, payload_length, 0x55))  # Type: U (URL)
+                record_data = bytes((prefix_found,)) + remaining_bytes
         elif looks_like_web:
             # This looks like a web URL without explicit prefix, add http://
             prefix_found = 0x02  # http://
-            remaining_bytes = list(text.encode('utf-8'))
+            remaining_bytes = text_bytes
             payload_length = len(remaining_bytes) + 1  # +1 for the prefix byte
-            ndef_header = [0xD1, 0x01, payload_length, 0x55]  # Type: U (URL)
-            record_data = [prefix_found] + remaining_bytes
+            ndef_header = bytes((0xD1, 0x01, payload_length, 0x55))  # Type: U (URL)
+            record_data = bytes((prefix_found,)) + remaining_bytes
         else:
             # Store as plain text (including tel: and mailto: URLs)
             payload_length = len(text_bytes) + 1  # +1 for language code length
-            ndef_header = [0xD1, 0x01, payload_length, 0x54, 0x00]  # Type: T (Text)
+            ndef_header = bytes((0xD1, 0x01, payload_length, 0x54, 0x00))  # Type: T (Text)
             record_data = text_bytes
         
         # Calculate total length including headers
         total_length = len(ndef_header) + len(record_data)
         
         # TLV format: 0x03 (NDEF) + length + NDEF message + 0xFE (terminator)
-        ndef_data = [0x03, total_length] + ndef_header + record_data + [0xFE]
+        ndef_data = bytes((0x03, total_length)) + ndef_header + record_data + b'\xFE'
         
         return ndef_data
     
+    def stop_batch_write(self):
+        """Stop a running batch write after the current tag."""
+        self.writing = False
+    
     def batch_write_tags(self, reader, url: str, quantity: int, lock: bool = True, 
                          progress_callback: Optional[Callable[[int, int], None]] = None,
                          status_callback: Optional[Callable[[str], None]] = None) -> bool:
@@ -270,84 +281,85 @@ class NFCWriter:
         """
         tags_written = 0
         last_uid = None
+        self.writing = True
         
         if status_callback:
             status_callback(f"Ready to write URL: {url}")
         
         try:
-            while tags_written < quantity:
+            # The NDEF message and UID command are the same for every tag in the batch
+            ndef_data = self._create_url_ndef(url)
+            get_uid = get_reader_specific_commands(str(reader.reader))['GET_UID']
+            
+            while tags_written < quantity and self.writing:
                 try:
-                    connection, connected = reader.connect_with_retry()
-                    if not connected:
-                        time.sleep(0.2)
+                    # Block in PC/SC until a tag is presented rather than sleeping between polls
+                    if not reader.wait_for_card():
+                        if not reader.reader:
+                            time.sleep(0.2)
                         continue
-                        
-                    # Get UID to check if it's a new tag
-                    reader_str = str(connection.getReader())
-                    commands = get_reader_specific_commands(reader_str)
                     
-                    # Add error handling for transmit operation
-                    try:
-                        response, sw1, sw2 = connection.transmit(commands['GET_UID'])
-                    except Exception as transmit_error:
-                        if self.debug_callback:
-                            self.debug_callback("Error", f"Transmit error: {str(transmit_error)}")
-                        # Safely disconnect and continue
+                    # The connection stays open between polls while the same tag is present
+                    with reader.card_connection(keep_alive=True) as connection:
+                        if connection is None:
+                            time.sleep(0.2)
+                            continue
+                        
+                        # Get UID to check if it's a new tag
+                        # Add error handling for transmit operation
                         try:
-                            connection.disconnect()
-                        except:
-                            pass
-                        time.sleep(0.3)  # Slightly longer delay after error
-                        continue
-                    
-                    if sw1 == 0x90:
-                        uid = self.toHexString(response)
-                        if uid != last_uid:  # Only write to new tags
-                            last_uid = uid
-                            
-                            if status_callback:
-                                status_callback(f"Writing to tag {uid}...")
-                            
-                            # Write the URL with additional error handling
-                            try:
-                                success, message = self.write_url_to_tag(connection, url, lock)
-                            except Exception as write_error:
-                                if self.debug_callback:
-                                    self.debug_callback("Error", f"Write operation error: {str(write_error)}")
-                                success = False
-                                message = f"Write failed: {str(write_error)}"
-                            
-                            if success:
-                                tags_written += 1
+                            response, sw1, sw2 = connection.transmit(get_uid)
+                        except Exception as transmit_error:
+                            if self.debug_callback:
+                                self.debug_callback("Error", f"Transmit error: {str(transmit_error)}")
+                            # Drop the connection and continue
+                            reader.release_connection()
+                            time.sleep(0.3)  # Slightly longer delay after error
+                            continue
+                        
+                        if sw1 == 0x90:
+                            uid = bytes(response).hex(' ').upper()
+                            if uid != last_uid:  # Only write to new tags
+                                last_uid = uid
+                                
+                                if status_callback:
+                                    status_callback(f"Writing to tag {uid}...")
                                 
-                                if progress_callback:
-                                    progress_callback(tags_written, quantity)
+                                # Write the URL with additional error handling
+                                try:
+                                    success, message = self.write_url_to_tag(connection, url, lock, ndef_data)
+                                except Exception as write_error:
+                                    if self.debug_callback:
+                                        self.debug_callback("Error", f"Write operation error: {str(write_error)}")
+                                    success = False
+                                    message = f"Write failed: {str(write_error)}"
                                 
-                                if tags_written == quantity:
-                                    if status_callback:
-                                        status_callback(f"Successfully wrote {quantity} tags")
-                                    return True
+                                if success:
+                                    tags_written += 1
+                                    
+                                    if progress_callback:
+                                        progress_callback(tags_written, quantity)
+                                    
+                                    if tags_written == quantity:
+                                        if status_callback:
+                                            status_callback(f"Successfully wrote {quantity} tags")
+                                        return True
+                                    else:
+                                        if status_callback:
+                                            status_callback(f"Wrote tag {tags_written}/{quantity}. Please present next tag.")
                                 else:
                                     if status_callback:
-                                        status_callback(f"Wrote tag {tags_written}/{quantity}. Please present next tag.")
+                                        status_callback(f"Error: {message}")
                             else:
-                                if status_callback:
-                                    status_callback(f"Error: {message}")
-                    
-                    # Always try to disconnect, but don't crash if it fails
-                    try:
-                        connection.disconnect()
-                    except Exception as disconnect_error:
-                        if self.debug_callback:
-                            self.debug_callback("Debug", f"Disconnect error: {str(disconnect_error)}")
+                                # The last tag is still on the reader; check again shortly
+                                time.sleep(0.2)
+                        else:
+                            reader.release_connection()
+                            time.sleep(0.2)
                     
                 except Exception as e:
                     error_msg = str(e)
-                    if not any(msg in error_msg.lower() for msg in [
-                        "card is not connected",
-                        "no smart card inserted",
-                        "card is unpowered"
-                    ]) and status_callback:
+                    if not is_disconnect_error(error_msg) and status_callback:
                         status_callback(f"Error: {error_msg}")
                     
                     # Small delay to prevent CPU overload
@@ -359,5 +371,8 @@ class NFCWriter:
             if self.debug_callback:
                 self.debug_callback("Error", f"Critical error in batch_write_tags: {str(e)}")
             return False
+        finally:
+            self.writing = False
+            reader.release_connection()
             
         return tags_written > 0
\ No newline at end of file
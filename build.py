@@ -45,6 +45,9 @@ def build_executable():
         (os.path.join(src_dir, 'launcher-icon', 'icon.png'), 'launcher-icon'),
         # Images
         (os.path.join(src_dir, 'images', 'acr_1252.png'), 'images'),
+        (os.path.join(src_dir, 'images', 'check.svg'), 'images'),
+        # About tab manual
+        (os.path.join(src_dir, 'app', 'ui', 'manual.html'), os.path.join('app', 'ui')),
     ]
     
     # Verify all resources exist
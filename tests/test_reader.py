@@ -0,0 +1,98 @@
+"""
+Regression tests for the FAST_READ fallback in NFCReader.read_pages.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from app.reader import NFCReader
+from app.utils import READ_PAGE, get_reader_specific_commands
+
+COMMANDS = get_reader_specific_commands("ACR122U")
+
+
+class FakeConnection:
+    """Card connection answering FAST_READ like a given reader and tag."""
+
+    def __init__(self, fast_read):
+        self.fast_read = fast_read  # 'ok', 'nak', 'rejected' or 'error'
+        self.halted = False
+        self.connects = 0
+        self.fast_reads = 0
+
+    def connect(self, **kwargs):
+        self.connects += 1
+        self.halted = False
+
+    def disconnect(self):
+        pass
+
+    def transmit(self, apdu):
+        if apdu[5:8] == [0xD4, 0x42, 0x3A]:
+            self.fast_reads += 1
+            if self.fast_read == 'error':
+                raise Exception("Card was removed")
+            if self.fast_read == 'rejected':
+                return [], 0x63, 0x00
+            if self.fast_read == 'nak':
+                self.halted = True
+                return [0xD5, 0x43, 0x01], 0x90, 0x00
+            pages = apdu[-1] - apdu[-2] + 1
+            return [0xD5, 0x43, 0x00] + [apdu[-2]] * pages * 4, 0x90, 0x00
+        if self.halted:
+            return [], 0x63, 0x00
+        if apdu[:2] == READ_PAGE[:2]:
+            return [apdu[3]] * apdu[4], 0x90, 0x00
+        return [0x01, 0x02, 0x03, 0x04], 0x90, 0x00  # GET_UID
+
+
+def make_reader():
+    return NFCReader(lambda: [], None)
+
+
+def test_fast_read():
+    reader = make_reader()
+    connection = FakeConnection('ok')
+    data, sw1, _ = reader.read_pages(connection, COMMANDS, 4, 8)
+    assert sw1 == 0x90 and data == [4] * 32
+    assert reader._fast_read_supported is True
+
+
+def test_card_nak_reselects_and_only_skips_that_card():
+    reader = make_reader()
+    connection = FakeConnection('nak')
+    data, sw1, _ = reader.read_pages(connection, COMMANDS, 4, 8)
+    assert sw1 == 0x90 and data[:4] == [4] * 4
+    assert connection.connects == 1
+    assert reader._fast_read_supported is True
+
+    # The same card is not sent FAST_READ again
+    reader.read_pages(connection, COMMANDS, 8, 8)
+    assert connection.fast_reads == 1
+
+    # A newly connected card is, even without card presence tracking
+    reader.release_connection()
+    connection = FakeConnection('ok')
+    data, _, _ = reader.read_pages(connection, COMMANDS, 4, 8)
+    assert connection.fast_reads == 1 and data == [4] * 32
+
+
+def test_reader_rejection_disables_fast_read():
+    reader = make_reader()
+    connection = FakeConnection('rejected')
+    data, sw1, _ = reader.read_pages(connection, COMMANDS, 4, 8)
+    assert sw1 == 0x90 and data[:4] == [4] * 4
+    assert reader._fast_read_supported is False
+
+    reader.release_connection()
+    reader.read_pages(connection, COMMANDS, 4, 8)
+    assert connection.fast_reads == 1
+
+
+def test_transport_error_does_not_disable_fast_read():
+    reader = make_reader()
+    connection = FakeConnection('error')
+    data, sw1, _ = reader.read_pages(connection, COMMANDS, 4, 8)
+    assert sw1 == 0x90 and data[:4] == [4] * 4
+    assert reader._fast_read_supported is None
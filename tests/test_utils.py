@@ -0,0 +1,36 @@
+"""
+Regression tests for NDEF URL extraction.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from app.utils import extract_url_from_data
+
+# NDEF TLV holding a URI record for "http://aa" (payload length 3), then the terminator
+NDEF_TLV = bytes.fromhex("03 07 d1 01 03 55 02 61 61 fe")
+
+# Capability container as returned at the start of read_tag_memory data
+CC = bytes.fromhex("e1 10 12 00")
+
+
+def test_tag_memory_layout():
+    """Data starting with the capability container (read_tag_memory)."""
+    data = CC + NDEF_TLV + bytes(8)
+    assert extract_url_from_data(data, None, 4) == "http://aa"
+    assert extract_url_from_data(data, None) == "http://aa"
+
+
+def test_full_memory_layout():
+    """Data starting at page 4 (read_tag_memory_full), where index 4 is not a TLV."""
+    data = NDEF_TLV + bytes(8)
+    assert extract_url_from_data(data, None, 0) == "http://aa"
+    assert extract_url_from_data(data, None) == "http://aa"
+
+
+def test_wrong_offset_falls_back_to_scan():
+    """A 0x03 byte at the expected offset that holds no record does not hide the real TLV."""
+    data = NDEF_TLV + bytes(8)
+    assert data[4] == 0x03
+    assert extract_url_from_data(data, None, 4) == "http://aa"
@@ -0,0 +1,35 @@
+"""
+Regression tests for NDEF record type selection in NFCWriter.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from app.writer import NFCWriter
+
+
+def record_type(text):
+    """Return the NDEF record type byte _create_url_ndef chose for text."""
+    return NFCWriter(None)._create_url_ndef(text)[5]
+
+
+@pytest.mark.parametrize("text", [
+    "example.com",
+    "EXAMPLE.COM/page",
+    "shop.community",
+    "foo.network",
+    "x.apple",
+    "my.iot-device",
+])
+def test_tld_anywhere_in_text_is_a_web_url(text):
+    """A listed TLD counts as a substring, not only as a whole domain label."""
+    ndef = NFCWriter(None)._create_url_ndef(text)
+    assert ndef[5] == 0x55
+    assert ndef[6] == 0x02  # http://
+    assert ndef[7:-1] == text.encode('utf-8')
+
+
+@pytest.mark.parametrize("text", ["hello world", "example", "mailto:a@b", "x.c0m"])
+def test_other_text_is_a_text_record(text):
+    assert record_type(text) == 0x54